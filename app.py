@@ -17,6 +17,7 @@ from typing import Tuple
 # Data layer
 from clients import DataSourceClient, GitHubClient
 from clients.adapters import (
+    CachingAdapter,
     IDAdapter,
     KeyNormalizationAdapter,
     StockInitializationAdapter,
@@ -87,7 +88,8 @@ def setup_data_source(force_external: bool = False) -> DataSourceClient:
     github = GitHubClient(
         owner=config.GITHUB_OWNER,
         repo=config.GITHUB_REPO,
-        branch=config.GITHUB_BRANCH
+        branch=config.GITHUB_BRANCH,
+        cache_dir=config.HTTP_CACHE_DIR
     )
     
     # ──────────────────────────────────────────────────────
@@ -104,10 +106,12 @@ def setup_data_source(force_external: bool = False) -> DataSourceClient:
         external_source=ingredientes_with_ids
     )
     
-    ingredientes_source = StockInitializationAdapter(
+    # Cached: DataSourceClient and the menu's IngredientReferenceAdapter both
+    # fetch ingredientes concurrently during initialize; they share one run
+    ingredientes_source = CachingAdapter(StockInitializationAdapter(
         external_source=ingredientes_normalized,
         **DEFAULT_STOCK_CONFIG
-    )
+    ))
     
     # ──────────────────────────────────────────────────────
     # Menu chain: GitHub → IDs → KeyNorm → IngredientRef
@@ -147,8 +151,8 @@ def setup_data_source(force_external: bool = False) -> DataSourceClient:
     # Initialize ventas manually (no external source, only local file)
     # Load from local file if exists, otherwise create empty
     try:
-        ventas_data = data_source._load_local('ventas')
-        data_source._data_store['ventas'] = ventas_data
+        data_source.reload_from_disk(['ventas'])
+        ventas_data = data_source.get('ventas')
         print(f"✅ Initialized ventas (loaded {len(ventas_data)} items from local file)")
     except FileNotFoundError:
         # ventas.json doesn't exist yet, create it with empty array
@@ -6,9 +6,10 @@ Date: November 16, 2025
 """
 
 from .data_source_client import DataSourceClient
-from .external_sources import GitHubClient
+from .external_sources import GitHubClient, FrozenSource
 
 __all__ = [
     'DataSourceClient',
     'GitHubClient',
+    'FrozenSource',
 ]
@@ -2,6 +2,7 @@
 Adapters for external data sources.
 
 Adapters wrap ExternalSourceClients to add functionality like:
+- Caching fetched data in memory
 - Adding stable IDs to data
 - Normalizing dictionary keys
 - Transforming data formats
@@ -11,9 +12,10 @@ Author: Rafael Correa
 Date: November 14, 2025
 """
 
+from .caching_adapter import CachingAdapter
 from .id_adapter import IDAdapter
 from .key_normalization_adapter import KeyNormalizationAdapter
 from .stock_initialization_adapter import StockInitializationAdapter
 from .ingredient_reference_adapter import IngredientReferenceAdapter
 
-__all__ = ['IDAdapter', 'KeyNormalizationAdapter', 'StockInitializationAdapter', 'IngredientReferenceAdapter']
+__all__ = ['CachingAdapter', 'IDAdapter', 'KeyNormalizationAdapter', 'StockInitializationAdapter', 'IngredientReferenceAdapter']
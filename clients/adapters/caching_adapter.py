@@ -0,0 +1,88 @@
+"""
+Caching Adapter for external data sources.
+
+Wraps an ExternalSourceClient and memoizes fetched data per identifier, so
+repeated fetches of the same file (e.g., from GitHub) hit the network once.
+
+Author: Rafael Correa
+Date: November 17, 2025
+"""
+
+import copy
+import threading
+from typing import Any, Dict, Iterable
+from clients.external_sources.external_source_client import ExternalSourceClient
+
+
+class CachingAdapter(ExternalSourceClient):
+    """
+    Adapter that keeps the first fetch of each identifier in memory.
+    
+    Every call returns a deep copy of the cached data, so downstream
+    adapters that mutate their input (IDs, stock, references) cannot
+    poison the cache for later callers.
+    
+    Safe to share between threads: concurrent first fetches of the same
+    identifier wait for a single upstream fetch instead of repeating it.
+    
+    Example:
+        >>> github = GitHubClient(owner='user', repo='data', branch='main')
+        >>> cached = CachingAdapter(github)
+        >>> data = cached.fetch_data('menu.json')   # Network request
+        >>> again = cached.fetch_data('menu.json')  # Served from memory
+    """
+    
+    def __init__(self, external_source: ExternalSourceClient):
+        """
+        Initialize the adapter.
+        
+        Args:
+            external_source: The underlying external source (e.g., GitHubClient)
+        """
+        self.external_source = external_source
+        self._cache: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+    
+    def fetch_data(self, identifier: str, **kwargs) -> Any:
+        """
+        Fetch data from the cache, delegating to the wrapped source on a miss.
+        
+        Args:
+            identifier: Data identifier (e.g., 'ingredientes.json')
+            **kwargs: Additional arguments passed to external source on a miss
+        
+        Returns:
+            Deep copy of the cached data
+        
+        Raises:
+            Any exceptions from the underlying external source
+        """
+        if identifier not in self._cache:
+            # One lock per identifier: different files still fetch in parallel
+            with self._locks_guard:
+                lock = self._locks.setdefault(identifier, threading.Lock())
+            with lock:
+                if identifier not in self._cache:
+                    self._cache[identifier] = self.external_source.fetch_data(identifier, **kwargs)
+        
+        return copy.deepcopy(self._cache[identifier])
+    
+    def prefetch(self, identifiers: Iterable[str], **kwargs) -> None:
+        """
+        Warm the cache for several identifiers with one concurrent batch.
+        
+        Identifiers already cached are skipped; the rest are fetched through
+        the wrapped source's fetch_many, so their round-trips overlap.
+        
+        Args:
+            identifiers: Identifiers to load (e.g., ['ingredientes.json', 'menu.json'])
+            **kwargs: Additional arguments passed to external source
+        """
+        missing = [identifier for identifier in identifiers if identifier not in self._cache]
+        if missing:
+            self._cache.update(self.external_source.fetch_many(missing, **kwargs))
+    
+    def clear(self) -> None:
+        """Drop every cached payload (the next fetch goes to the source again)."""
+        self._cache.clear()
@@ -11,7 +11,8 @@ Author: Rafael Correa
 Date: November 16, 2025
 """
 
-from typing import Dict, List, Any, Optional
+import threading
+from typing import Dict, List, Any, Optional, Tuple
 from clients.external_sources.external_source_client import ExternalSourceClient
 
 
@@ -45,23 +46,25 @@ class IngredientReferenceAdapter(ExternalSourceClient):
         """
         self.external_source = external_source
         self.ingredientes_source = ingredientes_source
-        self._ingredientes_lookup: Optional[Dict[str, Dict[str, str]]] = None
+        self._ingredientes_lookup: Optional[Dict[Tuple[str, str], str]] = None
         self._ingredientes_fetched = False
+        self._ingredientes_lock = threading.Lock()
     
-    def _build_ingredientes_lookup(self, ingredientes_data: Any) -> Dict[str, Dict[str, str]]:
+    def _build_ingredientes_lookup(self, ingredientes_data: Any) -> Dict[Tuple[str, str], str]:
         """
-        Build a lookup table: {categoria: {nombre: id}}.
+        Build a flat lookup table: {(categoria, nombre): id}.
         
         Args:
             ingredientes_data: Ingredients data structure (can be list or dict)
         
         Returns:
-            Nested dict for fast ingredient ID lookup
+            Flat dict for O(1) ingredient ID lookup
         
         Example:
             {
-                'Pan': {'simple': 'pan_simple_abc123', 'frances': 'pan_frances_def456'},
-                'Salchicha': {'weiner': 'salchicha_weiner_ghi789'},
+                ('Pan', 'simple'): 'pan_simple_abc123',
+                ('Pan', 'frances'): 'pan_frances_def456',
+                ('Salchicha', 'weiner'): 'salchicha_weiner_ghi789',
                 ...
             }
         """
@@ -83,14 +86,11 @@ class IngredientReferenceAdapter(ExternalSourceClient):
                 
                 # Capitalize categoria for lookup (Pan, Salchicha, etc.)
                 categoria_key = categoria.capitalize()
-                lookup[categoria_key] = {}
                 
-                # Build name -> id mapping
+                # Build (categoria, name) -> id mapping
                 for item in opciones:
                     if isinstance(item, dict) and 'id' in item and 'nombre' in item:
-                        nombre = item['nombre']
-                        item_id = item['id']
-                        lookup[categoria_key][nombre] = item_id
+                        lookup[(categoria_key, item['nombre'])] = item['id']
         
         # Handle GROUPED structure as dict (original format)
         # Format: {'Pan': [...], 'Salchicha': [...], ...}
@@ -99,14 +99,10 @@ class IngredientReferenceAdapter(ExternalSourceClient):
                 if not isinstance(items, list):
                     continue
                 
-                lookup[categoria] = {}
-                
-                # Build name -> id mapping
+                # Build (categoria, name) -> id mapping
                 for item in items:
                     if isinstance(item, dict) and 'id' in item and 'nombre' in item:
-                        nombre = item['nombre']
-                        item_id = item['id']
-                        lookup[categoria][nombre] = item_id
+                        lookup[(categoria, item['nombre'])] = item['id']
         
         return lookup
     
@@ -124,8 +120,7 @@ class IngredientReferenceAdapter(ExternalSourceClient):
         if not self._ingredientes_lookup:
             return None
         
-        categoria_lookup = self._ingredientes_lookup.get(categoria, {})
-        return categoria_lookup.get(nombre)
+        return self._ingredientes_lookup.get((categoria, nombre))
     
     def _convert_reference(
         self,
@@ -232,11 +227,13 @@ class IngredientReferenceAdapter(ExternalSourceClient):
         Returns:
             Menu data with ingredient references converted to {id, nombre} objects
         """
-        # Fetch ingredientes ONCE on first call
+        # Fetch ingredientes ONCE on first call (locked: fetch_data may run concurrently)
         if not self._ingredientes_fetched:
-            ingredientes_data = self.ingredientes_source.fetch_data('ingredientes.json', **kwargs)
-            self._ingredientes_lookup = self._build_ingredientes_lookup(ingredientes_data)
-            self._ingredientes_fetched = True
+            with self._ingredientes_lock:
+                if not self._ingredientes_fetched:
+                    ingredientes_data = self.ingredientes_source.fetch_data('ingredientes.json', **kwargs)
+                    self._ingredientes_lookup = self._build_ingredientes_lookup(ingredientes_data)
+                    self._ingredientes_fetched = True
         
         # Fetch menu data
         menu_data = self.external_source.fetch_data(identifier, **kwargs)
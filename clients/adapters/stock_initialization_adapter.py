@@ -103,42 +103,35 @@ class StockInitializationAdapter(ExternalSourceClient):
                 self.default_stock
             )
             
-            # Process opciones if they exist
-            if 'opciones' in category_copy:
-                opciones_with_stock = []
-                
-                for option in category_copy['opciones']:
-                    if isinstance(option, dict):
-                        # Copy option and add stock field
-                        option_copy = option.copy()
-                        
-                        # Only add stock if it doesn't already exist
-                        if 'stock' not in option_copy:
-                            option_copy['stock'] = stock_value
-                        
-                        opciones_with_stock.append(option_copy)
-                    else:
-                        opciones_with_stock.append(option)
-                
-                category_copy['opciones'] = opciones_with_stock
-            
-            # Handle 'Opciones' (non-normalized) as well
-            elif 'Opciones' in category_copy:
-                opciones_with_stock = []
-                
-                for option in category_copy['Opciones']:
-                    if isinstance(option, dict):
-                        option_copy = option.copy()
-                        
-                        if 'stock' not in option_copy:
-                            option_copy['stock'] = stock_value
-                        
-                        opciones_with_stock.append(option_copy)
-                    else:
-                        opciones_with_stock.append(option)
-                
-                category_copy['Opciones'] = opciones_with_stock
+            # Process opciones ('opciones' or non-normalized 'Opciones') in one pass
+            opciones_key = 'opciones' if 'opciones' in category_copy else 'Opciones'
+            if opciones_key in category_copy:
+                category_copy[opciones_key] = [
+                    self._with_stock(option, stock_value)
+                    for option in category_copy[opciones_key]
+                ]
             
             result.append(category_copy)
         
         return result
+    
+    @staticmethod
+    def _with_stock(option: Any, stock_value: int) -> Any:
+        """
+        Return a copy of an option with its stock field set.
+        
+        Args:
+            option: Ingredient option (non-dict values are returned as-is)
+            stock_value: Stock to set if the option doesn't already have one
+        
+        Returns:
+            Copied option with stock, or the original value if not a dict
+        """
+        if not isinstance(option, dict):
+            return option
+        
+        # Only add stock if it doesn't already exist
+        if 'stock' in option:
+            return option.copy()
+        
+        return {**option, 'stock': stock_value}
@@ -5,9 +5,12 @@ Author: Rafael Correa
 Date: November 12, 2025
 """
 
-import json
+import functools
 import os
-from typing import Any, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional
+from clients import json_codec
 from clients.external_sources.external_source_client import ExternalSourceClient
 
 
@@ -48,31 +51,53 @@ class DataSourceClient:
             sources: Dict mapping source names to their external clients
                     e.g., {'ingredientes': github_client, 'ventas': mongo_client}
             force_external: If True, ignores local files and fetches from external sources
+        
+        Sources that need an external fetch are fetched concurrently, since
+        each one is an independent network request (a single pending fetch
+        runs directly on the calling thread).
         """
+        # Register external clients and resolve which sources need a fetch
+        pending = []
         for name, external_client in sources.items():
             # Store the external client for this source
             self._external_sources[name] = external_client
             
+            if force_external:
+                pending.append(name)
+                continue
+            
+            # Try local first
+            try:
+                self._data_store[name] = self._load_local(name)
+            except FileNotFoundError:
+                # Local doesn't exist, fetch from external source
+                print(f"⚠️  No local file for {name}, fetching from external source...")
+                pending.append(name)
+            except Exception as e:
+                print(f"❌ Failed to initialize {name}: {e}")
+                raise
+        
+        # External fetches are independent network round-trips: run them concurrently
+        # (a single fetch has nothing to overlap with, so it skips the pool)
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                futures = {
+                    name: executor.submit(self._fetch_from_external, name)
+                    for name in pending
+                }
+            results = {name: future.result for name, future in futures.items()}
+        else:
+            results = {name: functools.partial(self._fetch_from_external, name) for name in pending}
+        
+        for name, result in results.items():
             try:
-                if force_external:
-                    # Force fetch from external source
-                    data = self._fetch_from_external(name)
-                else:
-                    # Try local first
-                    try:
-                        data = self._load_local(name)
-                    except FileNotFoundError:
-                        # Local doesn't exist, fetch from external source
-                        print(f"⚠️  No local file for {name}, fetching from external source...")
-                        data = self._fetch_from_external(name)
-                
-                # Store in memory
-                self._data_store[name] = data
-                print(f"✅ Initialized {name}")
-                
+                self._data_store[name] = result()
             except Exception as e:
                 print(f"❌ Failed to initialize {name}: {e}")
                 raise
+        
+        for name in sources:
+            print(f"✅ Initialized {name}")
     
     def get(self, name: str) -> Any:
         """
@@ -106,6 +131,21 @@ class DataSourceClient:
         # Persist to file
         self._save_local(name, data)
     
+    def reload_from_disk(self, names: Optional[Iterable[str]] = None) -> None:
+        """
+        Replace in-memory data with the contents of the local JSON files.
+        
+        Only reads the files; external sources are never contacted.
+        
+        Args:
+            names: Data identifiers to reload (default: every source in memory)
+        
+        Raises:
+            FileNotFoundError: If a local file doesn't exist
+        """
+        for name in list(self._data_store if names is None else names):
+            self._data_store[name] = self._load_local(name)
+    
     def _fetch_from_external(self, name: str) -> Any:
         """
         Fetch data from external source and save locally.
@@ -135,12 +175,53 @@ class DataSourceClient:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Local file not found: {filepath}")
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # Single read, parsed straight from bytes
+        with open(filepath, 'rb') as f:
+            return json_codec.loads(f.read())
+    
+    @staticmethod
+    def serialize(data: Any) -> bytes:
+        """
+        Serialize data to the exact bytes written to local JSON files.
+        
+        Useful to verify persisted files bytewise (e.g., comparing hashes)
+        without parsing them back.
+        
+        Args:
+            data: JSON serializable data
+        
+        Returns:
+            UTF-8 encoded JSON (indent=2, non-ASCII characters preserved)
+        """
+        return json_codec.dumps(data)
     
     def _save_local(self, name: str, data: Any) -> None:
-        """Save data to local JSON file."""
+        """
+        Save data to local JSON file.
+        
+        The file is left untouched when it already holds the same bytes;
+        otherwise it is written to a temporary file and swapped in with
+        os.replace, so readers never see a half-written JSON file. The
+        temporary name is unique per process and thread, so concurrent
+        writers (e.g. pytest-xdist workers sharing data/) never clobber
+        each other's temporary file.
+        """
         filepath = os.path.join(self.data_dir, f"{name}.json")
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+        content = self.serialize(data)
+        
+        # Unchanged payload: skip the write entirely
+        if os.path.exists(filepath) and os.path.getsize(filepath) == len(content):
+            with open(filepath, 'rb') as f:
+                if f.read() == content:
+                    return
+        
+        tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            # Don't leave the partial temporary file behind
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
\ No newline at end of file
@@ -7,8 +7,10 @@ Date: November 14, 2025
 
 from .external_source_client import ExternalSourceClient
 from .github_client import GitHubClient
+from .frozen_source import FrozenSource
 
 __all__ = [
     'ExternalSourceClient',
     'GitHubClient',
+    'FrozenSource',
 ]
@@ -9,7 +9,8 @@ Updated: November 14, 2025 - Added ID contract documentation
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable
 
 
 class ExternalSourceClient(ABC):
@@ -60,4 +61,33 @@ class ExternalSourceClient(ABC):
         Raises:
             Exception: Implementation-specific exceptions for fetch failures
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def fetch_many(self, identifiers: Iterable[str], **kwargs) -> Dict[str, Any]:
+        """
+        Fetch several identifiers concurrently.
+        
+        Each identifier is an independent fetch_data call, so they run in a
+        thread pool; total latency is roughly that of the slowest fetch.
+        
+        Args:
+            identifiers: Identifiers to fetch (e.g., ['ingredientes.json', 'menu.json'])
+            **kwargs: Additional parameters passed to every fetch_data call
+        
+        Returns:
+            Dict mapping each identifier to its fetched data
+        
+        Raises:
+            Exception: The first fetch failure, re-raised from fetch_data
+        """
+        identifiers = list(identifiers)
+        if len(identifiers) <= 1:
+            return {identifier: self.fetch_data(identifier, **kwargs) for identifier in identifiers}
+        
+        with ThreadPoolExecutor(max_workers=len(identifiers)) as executor:
+            futures = {
+                identifier: executor.submit(self.fetch_data, identifier, **kwargs)
+                for identifier in identifiers
+            }
+        
+        return {identifier: future.result() for identifier, future in futures.items()}
@@ -0,0 +1,54 @@
+"""
+Frozen in-memory source for already materialized data.
+
+Serves data that was produced earlier (e.g., by a full adapter chain) without
+touching the network. Useful for reloads and tests that must not hit GitHub.
+
+Author: Rafael Correa
+Date: November 17, 2025
+"""
+
+import copy
+from typing import Any, Dict
+from clients.external_sources.external_source_client import ExternalSourceClient
+
+
+class FrozenSource(ExternalSourceClient):
+    """
+    External source backed by a fixed {identifier: data} mapping.
+    
+    Each fetch returns a deep copy, so callers can mutate the result without
+    affecting later fetches.
+    
+    Example:
+        >>> frozen = FrozenSource({'ingredientes.json': data_source.get('ingredientes')})
+        >>> data = frozen.fetch_data('ingredientes.json')  # No network IO
+    """
+    
+    def __init__(self, payloads: Dict[str, Any]):
+        """
+        Initialize the frozen source.
+        
+        Args:
+            payloads: Dict mapping identifiers (e.g., 'menu.json') to their data
+        """
+        self.payloads = dict(payloads)
+    
+    def fetch_data(self, identifier: str, **kwargs) -> Any:
+        """
+        Return a copy of the frozen data for an identifier.
+        
+        Args:
+            identifier: Data identifier (e.g., 'ingredientes.json')
+            **kwargs: Ignored (kept for interface compatibility)
+        
+        Returns:
+            Deep copy of the stored data
+        
+        Raises:
+            KeyError: If no data was frozen for this identifier
+        """
+        if identifier not in self.payloads:
+            raise KeyError(f"No frozen data for '{identifier}'")
+        
+        return copy.deepcopy(self.payloads[identifier])
@@ -5,15 +5,25 @@ Author: Rafael Correa
 Date: November 12, 2025
 """
 
+import os
+import threading
 import requests
-from typing import Any
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Optional, Tuple
+from clients import json_codec
 from clients.external_sources.external_source_client import ExternalSourceClient
 
 
 class GitHubClient(ExternalSourceClient):
     """Client for downloading JSON files from GitHub repositories."""
     
-    def __init__(self, owner: str, repo: str, branch: str = "main"):
+    def __init__(
+        self,
+        owner: str,
+        repo: str,
+        branch: str = "main",
+        cache_dir: Optional[str] = None
+    ):
         """
         Initialize the GitHub client.
         
@@ -21,19 +31,37 @@ class GitHubClient(ExternalSourceClient):
             owner: Repository owner (user or organization)
             repo: Repository name
             branch: Repository branch (default: main)
+            cache_dir: Optional directory where ETags and bodies are persisted,
+                      so conditional requests also work across processes
+                      (default: None, in-memory only)
         """
         self.owner = owner
         self.repo = repo
         self.branch = branch
+        self.cache_dir = cache_dir
         self.base_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}"
+        
+        # Reuse TCP/TLS connections across fetches. The pool holds one connection
+        # per fetch_many worker; requests does not document Session as thread-safe,
+        # so no per-request state (cookies, auth, headers) is set on it
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
+        
+        # Conditional requests: {identifier: (etag, raw_body)}; a 304 skips the body
+        self._etag_cache: Dict[str, Tuple[str, bytes]] = {}
     
     def fetch_data(self, identifier: str, **kwargs) -> Any:
         """
         Download a JSON file from the repository.
         
+        Repeated fetches send If-None-Match with the last ETag; when GitHub
+        answers 304 Not Modified the cached body is decoded again, so every
+        call returns fresh objects.
+        
         Args:
             identifier: File path in the repository (e.g., "ingredientes.json")
-            **kwargs: Additional parameters (timeout, etc.)
+            **kwargs: Additional parameters (timeout, etc.). The default timeout is
+                (connect, read) = (3.05, 10) so unreachable hosts fail fast
         
         Returns:
             The parsed JSON data (dict or list)
@@ -42,14 +70,78 @@ class GitHubClient(ExternalSourceClient):
             requests.RequestException: If there's a network error
             ValueError: If the content is not valid JSON
         """
-        timeout = kwargs.get('timeout', 10)
+        timeout = kwargs.get('timeout', (3.05, 10))
         url = f"{self.base_url}/{identifier}"
         
+        headers = {}
+        cached = self._etag_cache.get(identifier)
+        if cached is None and self.cache_dir:
+            cached = self._load_cached(identifier)
+        if cached is not None:
+            headers['If-None-Match'] = cached[0]
+        
         try:
-            response = requests.get(url, timeout=timeout)
+            response = self.session.get(url, timeout=timeout, headers=headers)
+            
+            # Unchanged since last fetch: no body was transferred
+            if response.status_code == 304 and cached is not None:
+                return json_codec.loads(cached[1])
+            
             response.raise_for_status()  # Raises exception if status != 200
-            return response.json()
+            
+            etag = response.headers.get('ETag')
+            if etag:
+                self._etag_cache[identifier] = (etag, response.content)
+                if self.cache_dir:
+                    self._store_cached(identifier, etag, response.content)
+            
+            # Parse straight from bytes (orjson errors subclass ValueError)
+            return json_codec.loads(response.content)
         except requests.RequestException as e:
             raise requests.RequestException(f"Error downloading {identifier}: {e}")
         except ValueError as e:
-            raise ValueError(f"File {identifier} does not contain valid JSON: {e}")
\ No newline at end of file
+            raise ValueError(f"File {identifier} does not contain valid JSON: {e}")
+    
+    def _cache_path(self, identifier: str) -> str:
+        """
+        Path of the cache entry (ETag line + body) for an identifier.
+        
+        Entries live under one directory per owner/repo/branch, so clients
+        for different repositories or branches can share a cache_dir.
+        """
+        namespace = f"{self.owner}__{self.repo}__{self.branch}".replace('/', '__')
+        return os.path.join(self.cache_dir, namespace, f"{identifier.replace('/', '__')}.entry")
+    
+    def _load_cached(self, identifier: str) -> Optional[Tuple[str, bytes]]:
+        """Load a persisted (etag, body) pair, or None if it is missing."""
+        try:
+            with open(self._cache_path(identifier), 'rb') as f:
+                etag_line, body = f.read().split(b'\n', 1)
+        except (OSError, ValueError):
+            return None
+        
+        etag = etag_line.decode('utf-8')
+        self._etag_cache[identifier] = (etag, body)
+        return etag, body
+    
+    def _store_cached(self, identifier: str, etag: str, body: bytes) -> None:
+        """
+        Persist an (etag, body) pair; failures only cost a full download later.
+        
+        ETag and body share one file, written to a per-process temporary file
+        and swapped in with os.replace: processes sharing the cache_dir (e.g.
+        pytest-xdist workers) never pair one response's ETag with another's
+        body or read a partial entry.
+        """
+        path = self._cache_path(identifier)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(etag.encode('utf-8') + b'\n' + body)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
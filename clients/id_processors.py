@@ -9,16 +9,19 @@ Author: Rafael Correa
 Date: November 14, 2025
 """
 
+import functools
 import hashlib
 from typing import Any, List, Dict, Tuple, Optional
 
 
+@functools.lru_cache(maxsize=4096)
 def generate_stable_id(natural_key: str, category: str = "") -> str:
     """
     Generate a stable UUID based on natural key and optional category.
     
     Same inputs always produce the same ID, ensuring consistency when
-    reloading data from external sources.
+    reloading data from external sources. Results are memoized, so repeated
+    (natural_key, category) pairs are hashed only once.
     
     Args:
         natural_key: The natural identifier (e.g., 'simple', 'weiner')
@@ -36,8 +39,9 @@ def generate_stable_id(natural_key: str, category: str = "") -> str:
     # Combine inputs for uniqueness
     seed = f"{category}:{natural_key}" if category else natural_key
     
-    # Generate MD5 hash
-    hash_digest = hashlib.md5(seed.encode('utf-8')).hexdigest()
+    # Generate MD5 hash (an identifier, not a security primitive; MD5 is kept
+    # because switching algorithms would change every persisted ID)
+    hash_digest = hashlib.md5(seed.encode('utf-8'), usedforsecurity=False).hexdigest()
     
     # Format as UUID (8-4-4-4-12)
     return (
@@ -74,6 +78,10 @@ def process_grouped_structure_ids(
         }
     ]
     
+    The input is never mutated: groups and items that receive an ID are
+    copied, everything else is shared with raw_data (returned as-is when
+    nothing was missing).
+    
     IDs are generated as: hash(Category:nombre)
     This ensures:
     - Same item always gets same ID
@@ -97,6 +105,10 @@ def process_grouped_structure_ids(
         ValueError: If natural_key_field value is missing in an item
     """
     modified = False
+    processed = []
+    
+    # Local alias: the loop body resolves it as a fast local, not a global
+    gen = generate_stable_id
     
     for group in raw_data:
         # Validate structure
@@ -107,10 +119,11 @@ def process_grouped_structure_ids(
         
         category = group[category_field]
         items = group[items_field]
+        new_items = None
         
-        for item in items:
-            # Check if ID already exists
-            if id_field not in item or not item[id_field]:
+        for index, item in enumerate(items):
+            # Check if ID already exists (missing or empty)
+            if not item.get(id_field):
                 # Validate natural key exists
                 if natural_key_field not in item:
                     raise ValueError(
@@ -123,11 +136,18 @@ def process_grouped_structure_ids(
                         f"Item in category '{category}' has empty '{natural_key_field}'"
                     )
                 
-                # Generate stable ID
-                item[id_field] = generate_stable_id(natural_key, category)
-                modified = True
+                # Generate stable ID; only this group and its new items are copied
+                if new_items is None:
+                    new_items = list(items)
+                new_items[index] = {**item, id_field: gen(natural_key, category)}
+        
+        if new_items is not None:
+            group = {**group, items_field: new_items}
+            modified = True
+        
+        processed.append(group)
     
-    return raw_data, modified
+    return (processed if modified else raw_data), modified
 
 
 def process_flat_structure_ids(
@@ -147,6 +167,9 @@ def process_flat_structure_ids(
     
     IDs are generated as: hash(nombre) or hash(category:nombre) if category_field provided
     
+    The input is never mutated: items that receive an ID are copied, the
+    rest are shared with raw_data (returned as-is when nothing was missing).
+    
     Args:
         raw_data: List of items
         natural_key_field: Field used to generate ID (default: 'nombre')
@@ -162,10 +185,15 @@ def process_flat_structure_ids(
         ValueError: If natural_key_field value is missing in an item
     """
     modified = False
+    processed = []
+    
+    # Local aliases: the loop body resolves them as fast locals, not globals
+    gen = generate_stable_id
+    append = processed.append
     
     for item in raw_data:
-        # Check if ID already exists
-        if id_field not in item or not item[id_field]:
+        # Check if ID already exists (missing or empty)
+        if not item.get(id_field):
             # Validate natural key exists
             if natural_key_field not in item:
                 raise ValueError(f"Item missing required field '{natural_key_field}'")
@@ -174,13 +202,15 @@ def process_flat_structure_ids(
             if not natural_key:
                 raise ValueError(f"Item has empty '{natural_key_field}'")
             
-            # Generate stable ID (with or without category)
+            # Generate stable ID (with or without category) on a copy of the item
             if category_field and category_field in item:
                 category = item[category_field]
-                item[id_field] = generate_stable_id(natural_key, category)
+                item = {**item, id_field: gen(natural_key, category)}
             else:
-                item[id_field] = generate_stable_id(natural_key)
+                item = {**item, id_field: gen(natural_key)}
             
             modified = True
+        
+        append(item)
     
-    return raw_data, modified
\ No newline at end of file
+    return (processed if modified else raw_data), modified
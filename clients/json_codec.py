@@ -0,0 +1,55 @@
+"""
+JSON encoding and decoding for data files and HTTP payloads.
+
+Uses orjson when it is installed (a C parser/serializer that works directly
+on UTF-8 bytes) and falls back to the standard library otherwise. Both
+paths write the same format: 2-space indentation, non-ASCII characters
+kept as-is (e.g., 'Acompañante', not 'ñ').
+
+Author: Rafael Correa
+Date: November 17, 2025
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON from bytes or text.
+    
+    Args:
+        data: JSON document (bytes are parsed without decoding to str first)
+    
+    Returns:
+        The parsed data (dict, list or primitive)
+    
+    Raises:
+        ValueError: If the content is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Serialize data to pretty-printed UTF-8 JSON bytes.
+    
+    Args:
+        data: JSON serializable data
+    
+    Returns:
+        UTF-8 encoded JSON with 2-space indentation
+    
+    Raises:
+        TypeError: If data contains values that are not JSON serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
@@ -17,4 +17,11 @@ GITHUB_REPO = os.getenv('GITHUB_REPO', '')
 GITHUB_BRANCH = os.getenv('GITHUB_BRANCH', 'main')
 
 # Data directory
-DATA_DIR = os.getenv('DATA_DIR', 'data')
\ No newline at end of file
+DATA_DIR = os.getenv('DATA_DIR', 'data')
+
+# On-disk HTTP cache for GitHub (opt-in): ETags and bodies persist across runs,
+# so unchanged files come back as 304 Not Modified without a body
+HTTP_CACHE_DIR = (
+    os.path.join(DATA_DIR, '.http_cache')
+    if os.getenv('HOTDOG_HTTP_CACHE') == '1' else None
+)
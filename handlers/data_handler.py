@@ -16,7 +16,7 @@ Date: November 15, 2025
 
 from typing import Optional, List
 from models.collections import IngredientCollection, HotDogCollection, VentaCollection
-from models.core.base_entity import Entity
+from models.core.base_entity import EntityBase
 
 
 class DataHandler:
@@ -93,6 +93,19 @@ class DataHandler:
         """
         return any(collection.is_dirty for collection in self._collections)
     
+    @property
+    def version(self) -> int:
+        """
+        Monotonic change counter across all collections.
+        
+        Changes whenever any collection's entities change (see
+        BaseCollection.version), so it can key caches of derived data.
+        
+        Returns:
+            Sum of all collection versions
+        """
+        return sum(collection.version for collection in self._collections)
+    
     def commit(self) -> None:
         """
         Commit all changes across all collections.
@@ -161,7 +174,7 @@ class DataHandler:
     # Convenience Methods - Ingredients
     # ────────────────────────────────────────────────────────────
     
-    def get_ingredient(self, id: str) -> Optional[Entity]:
+    def get_ingredient(self, id: str) -> Optional[EntityBase]:
         """
         Get an ingredient by ID.
         
@@ -173,7 +186,7 @@ class DataHandler:
         """
         return self.ingredientes.get(id)
     
-    def get_ingredient_by_name(self, nombre: str, categoria: str) -> Optional[Entity]:
+    def get_ingredient_by_name(self, nombre: str, categoria: str) -> Optional[EntityBase]:
         """
         Get an ingredient by name and category.
         
@@ -189,7 +202,7 @@ class DataHandler:
         """
         return self.ingredientes.get_by_name(nombre, categoria)
     
-    def get_ingredients_by_category(self, categoria: str) -> List[Entity]:
+    def get_ingredients_by_category(self, categoria: str) -> List[EntityBase]:
         """
         Get all ingredients in a category.
         
@@ -208,7 +221,7 @@ class DataHandler:
     # Convenience Methods - Hot Dogs
     # ────────────────────────────────────────────────────────────
     
-    def get_hotdog(self, id: str) -> Optional[Entity]:
+    def get_hotdog(self, id: str) -> Optional[EntityBase]:
         """
         Get a hot dog by ID.
         
@@ -220,7 +233,7 @@ class DataHandler:
         """
         return self.menu.get(id)
     
-    def get_hotdog_by_name(self, nombre: str) -> Optional[Entity]:
+    def get_hotdog_by_name(self, nombre: str) -> Optional[EntityBase]:
         """
         Get a hot dog by name.
         
@@ -7,12 +7,29 @@ Author: Rafael Correa
 Date: November 13, 2025
 """
 
+from models.entities import ingredients as _ingredients
+from models.entities import hotdogs as _hotdogs
+from models.entities import ventas as _ventas
 from models.entities.ingredients import create_ingredient_entities
 from models.entities.hotdogs import create_hotdog_entities
 from models.entities.ventas import create_venta_entities
 
+
+def clear_entity_caches():
+    """
+    Discard the memoized fallback entity classes.
+    
+    The next create_*_entities() call regenerates them, picking up any
+    methods or validators registered since (mainly useful in tests).
+    """
+    _ingredients._fallback_ingredient_entities.cache_clear()
+    _hotdogs._fallback_hotdog_entities.cache_clear()
+    _ventas._build_venta_entities.cache_clear()
+
+
 __all__ = [
     'create_ingredient_entities',
     'create_hotdog_entities',
-    'create_venta_entities'
+    'create_venta_entities',
+    'clear_entity_caches'
 ]
\ No newline at end of file
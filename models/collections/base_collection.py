@@ -14,7 +14,7 @@ Date: November 15, 2025
 
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
-from models.core.base_entity import Entity
+from models.core.base_entity import EntityBase
 
 
 class BaseCollection(ABC):
@@ -34,6 +34,7 @@ class BaseCollection(ABC):
         _source_name: Name of the data source (e.g., 'ingredientes', 'menu')
         _items: Internal storage as {id: Entity}
         _dirty: Flag indicating if there are unsaved changes
+        _version: Counter bumped on every change to _items (see version)
     """
     
     def __init__(self, data_source, source_name: str):
@@ -46,8 +47,9 @@ class BaseCollection(ABC):
         """
         self._data_source = data_source
         self._source_name = source_name
-        self._items: Dict[str, Entity] = {}  # {id: Entity}
+        self._items: Dict[str, EntityBase] = {}  # {id: Entity}
         self._dirty = False  # Track if there are unsaved changes
+        self._version = 0  # Bumped on every add/update/delete/clear/reload
         
         # Load initial data
         self._load()
@@ -85,7 +87,7 @@ class BaseCollection(ABC):
     # CRUD Operations - READ
     # ────────────────────────────────────────────────────────────
     
-    def get(self, id: str) -> Optional[Entity]:
+    def get(self, id: str) -> Optional[EntityBase]:
         """
         Get an entity by its ID.
         
@@ -97,7 +99,7 @@ class BaseCollection(ABC):
         """
         return self._items.get(id)
     
-    def get_all(self) -> List[Entity]:
+    def get_all(self) -> List[EntityBase]:
         """
         Get all entities in the collection.
         
@@ -106,7 +108,19 @@ class BaseCollection(ABC):
         """
         return list(self._items.values())
     
-    def find(self, **criteria) -> List[Entity]:
+    def first(self) -> Optional[EntityBase]:
+        """
+        Get the first entity in the collection (in insertion order).
+        
+        Cheaper than get_all()[0] when a single entity is enough, since no
+        list is built.
+        
+        Returns:
+            First entity, or None if the collection is empty
+        """
+        return next(iter(self._items.values()), None)
+    
+    def find(self, **criteria) -> List[EntityBase]:
         """
         Find entities matching the given criteria.
         
@@ -165,7 +179,7 @@ class BaseCollection(ABC):
     # CRUD Operations - CREATE
     # ────────────────────────────────────────────────────────────
     
-    def add(self, entity: Entity) -> None:
+    def add(self, entity: EntityBase) -> None:
         """
         Add a new entity to the collection.
         
@@ -192,12 +206,13 @@ class BaseCollection(ABC):
         
         # Mark as dirty (needs flush)
         self._dirty = True
+        self._version += 1
     
     # ────────────────────────────────────────────────────────────
     # CRUD Operations - UPDATE
     # ────────────────────────────────────────────────────────────
     
-    def update(self, entity: Entity) -> None:
+    def update(self, entity: EntityBase) -> None:
         """
         Update an existing entity in the collection.
         
@@ -225,6 +240,7 @@ class BaseCollection(ABC):
         
         # Mark as dirty
         self._dirty = True
+        self._version += 1
     
     # ────────────────────────────────────────────────────────────
     # CRUD Operations - DELETE
@@ -250,6 +266,7 @@ class BaseCollection(ABC):
         
         # Mark as dirty
         self._dirty = True
+        self._version += 1
     
     def delete_where(self, **criteria) -> int:
         """
@@ -275,6 +292,7 @@ class BaseCollection(ABC):
         # Mark as dirty if any deleted
         if to_delete:
             self._dirty = True
+            self._version += 1
         
         return len(to_delete)
     
@@ -292,6 +310,20 @@ class BaseCollection(ABC):
         """
         return self._dirty
     
+    @property
+    def version(self) -> int:
+        """
+        Monotonic change counter for the entities in this collection.
+        
+        Bumped by add, update, delete, delete_where, clear and reload (not by
+        flush, which doesn't change the entities). Views derived from the
+        collection can be cached and reused while the version is unchanged.
+        
+        Returns:
+            Current version number
+        """
+        return self._version
+    
     def flush(self) -> None:
         """
         Persist all changes to the data source.
@@ -332,6 +364,7 @@ class BaseCollection(ABC):
         # Clear internal state
         self._items.clear()
         self._dirty = False
+        self._version += 1
         
         # Reload from source
         self._load()
@@ -350,6 +383,7 @@ class BaseCollection(ABC):
         if self._items:
             self._items.clear()
             self._dirty = True
+            self._version += 1
     
     def __len__(self) -> int:
         """
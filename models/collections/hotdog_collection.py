@@ -12,7 +12,7 @@ Date: November 15, 2025
 
 from typing import Optional, List
 from models.collections.base_collection import BaseCollection
-from models.core.base_entity import Entity
+from models.core.base_entity import EntityBase
 
 
 class HotDogCollection(BaseCollection):
@@ -120,7 +120,7 @@ class HotDogCollection(BaseCollection):
     # Domain-Specific Methods
     # ────────────────────────────────────────────────────────────
     
-    def get_by_name(self, nombre: str) -> Optional[Entity]:
+    def get_by_name(self, nombre: str) -> Optional[EntityBase]:
         """
         Get a hot dog by its name.
         
@@ -157,7 +157,7 @@ class HotDogCollection(BaseCollection):
         """
         return self.get_by_name(nombre) is not None
     
-    def get_with_topping(self, topping: str) -> List[Entity]:
+    def get_with_topping(self, topping: str) -> List[EntityBase]:
         """
         Get all hot dogs that include a specific topping.
         
@@ -180,7 +180,7 @@ class HotDogCollection(BaseCollection):
         
         return results
     
-    def get_with_salsa(self, salsa: str) -> List[Entity]:
+    def get_with_salsa(self, salsa: str) -> List[EntityBase]:
         """
         Get all hot dogs that include a specific salsa.
         
@@ -203,7 +203,7 @@ class HotDogCollection(BaseCollection):
         
         return results
     
-    def get_combos(self) -> List[Entity]:
+    def get_combos(self) -> List[EntityBase]:
         """
         Get all hot dogs that are combos (have acompañante).
         
@@ -223,7 +223,7 @@ class HotDogCollection(BaseCollection):
         
         return results
     
-    def get_simple_hotdogs(self) -> List[Entity]:
+    def get_simple_hotdogs(self) -> List[EntityBase]:
         """
         Get all simple hot dogs (no toppings, no salsas, no acompañante).
         
@@ -256,7 +256,7 @@ class HotDogCollection(BaseCollection):
         
         return results
     
-    def get_by_pan_type(self, pan: str) -> List[Entity]:
+    def get_by_pan_type(self, pan: str) -> List[EntityBase]:
         """
         Get all hot dogs that use a specific type of pan.
         
@@ -272,7 +272,7 @@ class HotDogCollection(BaseCollection):
         """
         return self.find(pan=pan)
     
-    def get_by_salchicha_type(self, salchicha: str) -> List[Entity]:
+    def get_by_salchicha_type(self, salchicha: str) -> List[EntityBase]:
         """
         Get all hot dogs that use a specific type of salchicha.
         
@@ -11,9 +11,9 @@ Author: Rafael Correa
 Date: November 15, 2025
 """
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from models.collections.base_collection import BaseCollection
-from models.core.base_entity import Entity
+from models.core.base_entity import EntityBase
 
 
 class IngredientCollection(BaseCollection):
@@ -45,6 +45,11 @@ class IngredientCollection(BaseCollection):
     Attributes:
         _entity_classes: Dict mapping category names to their entity classes
                         (e.g., {'Pan': PanClass, 'Salchicha': SalchichaClass})
+        _by_category: Index {entity_type: [entities]}
+        _by_name: Index {nombre: first entity with that name}
+        _by_name_category: Index {(nombre, entity_type): entity}
+        _by_category_tipo: Index {(entity_type, tipo): [entities]}
+        _index_version: Collection version the indexes were built for
     """
     
     def __init__(self, data_source):
@@ -57,6 +62,14 @@ class IngredientCollection(BaseCollection):
         # Store entity classes (will be populated in _load)
         self._entity_classes: Dict[str, type] = {}
         
+        # Lookup indexes, rebuilt lazily when the collection version changes
+        # (see _ensure_indexes)
+        self._by_category: Dict[str, List[EntityBase]] = {}
+        self._by_name: Dict[str, EntityBase] = {}
+        self._by_name_category: Dict[Tuple[str, str], EntityBase] = {}
+        self._by_category_tipo: Dict[Tuple[str, Any], List[EntityBase]] = {}
+        self._index_version = -1
+        
         # Call parent constructor (which calls _load)
         super().__init__(data_source, 'ingredientes')
     
@@ -150,11 +163,46 @@ class IngredientCollection(BaseCollection):
         
         return result
     
+    def _ensure_indexes(self) -> None:
+        """
+        Rebuild the category and name indexes if the collection changed.
+        
+        A single pass over self._items fills all four indexes, keeping
+        insertion order (so the "first match" semantics of find() hold).
+        Nothing is done while the collection version is unchanged, so
+        lookups between changes are plain dict hits.
+        """
+        if self._index_version == self._version:
+            return
+        
+        by_category: Dict[str, List[EntityBase]] = {}
+        by_name: Dict[str, EntityBase] = {}
+        by_name_category: Dict[Tuple[str, str], EntityBase] = {}
+        by_category_tipo: Dict[Tuple[str, Any], List[EntityBase]] = {}
+        
+        for entity in self._items.values():
+            entity_type = entity.entity_type
+            nombre = getattr(entity, 'nombre', None)
+            
+            by_category.setdefault(entity_type, []).append(entity)
+            by_name.setdefault(nombre, entity)
+            by_name_category.setdefault((nombre, entity_type), entity)
+            
+            # Only categories with a 'tipo' field (not Salsa) are indexed by type
+            if hasattr(entity, 'tipo'):
+                by_category_tipo.setdefault((entity_type, entity.tipo), []).append(entity)
+        
+        self._by_category = by_category
+        self._by_name = by_name
+        self._by_name_category = by_name_category
+        self._by_category_tipo = by_category_tipo
+        self._index_version = self._version
+    
     # ────────────────────────────────────────────────────────────
     # Domain-Specific Methods
     # ────────────────────────────────────────────────────────────
     
-    def get_by_category(self, categoria: str) -> List[Entity]:
+    def get_by_category(self, categoria: str) -> List[EntityBase]:
         """
         Get all ingredients of a specific category.
         
@@ -163,19 +211,60 @@ class IngredientCollection(BaseCollection):
                       Case-insensitive, will be capitalized automatically
         
         Returns:
-            List of entities in that category
+            List of entities in that category (a new list on every call)
             
         Example:
             panes = collection.get_by_category('Pan')
             salsas = collection.get_by_category('salsa')  # Auto-capitalized
+        
+        Note:
+            Served from the category index (see _ensure_indexes), which is
+            only rebuilt after the collection changes.
         """
         # Capitalize to match entity_type format
         entity_type = categoria.capitalize()
         
-        # Use base class find method
-        return self.find(entity_type=entity_type)
+        self._ensure_indexes()
+        return list(self._by_category.get(entity_type, ()))
     
-    def get_by_name(self, nombre: str, categoria: Optional[str] = None) -> Optional[Entity]:
+    def get_by_type(self, categoria: str, tipo: Any) -> List[EntityBase]:
+        """
+        Get all ingredients of a category with a specific 'tipo'.
+        
+        Args:
+            categoria: Category name (e.g., 'Pan'), case-insensitive
+            tipo: Type value to match (e.g., 'blanco')
+        
+        Returns:
+            List of matching entities (empty if the category has no 'tipo')
+            
+        Example:
+            panes_blancos = collection.get_by_type('Pan', 'blanco')
+        """
+        self._ensure_indexes()
+        return list(self._by_category_tipo.get((categoria.capitalize(), tipo), ()))
+    
+    def first_of_category(self, categoria: str) -> Optional[EntityBase]:
+        """
+        Get the first ingredient of a specific category.
+        
+        Reads the category index directly, without copying the list like
+        get_by_category() does.
+        
+        Args:
+            categoria: Category name (e.g., 'Pan'), case-insensitive
+        
+        Returns:
+            First entity in that category, or None if the category is empty
+            
+        Example:
+            pan = collection.first_of_category('Pan')
+        """
+        self._ensure_indexes()
+        entities = self._by_category.get(categoria.capitalize())
+        return entities[0] if entities else None
+    
+    def get_by_name(self, nombre: str, categoria: Optional[str] = None) -> Optional[EntityBase]:
         """
         Get an ingredient by name, optionally filtering by category.
         
@@ -191,14 +280,17 @@ class IngredientCollection(BaseCollection):
             pan = collection.get_by_name('simple', 'Pan')
             salsa = collection.get_by_name('mostaza')  # Search all categories
         """
-        criteria = {'nombre': nombre}
-        
-        if categoria:
-            criteria['entity_type'] = categoria.capitalize()
-        
-        results = self.find(**criteria)
+        self._ensure_indexes()
         
-        return results[0] if results else None
+        try:
+            if categoria:
+                return self._by_name_category.get((nombre, categoria.capitalize()))
+            
+            return self._by_name.get(nombre)
+        except TypeError:
+            # Unhashable nombre (e.g. an {'id', 'nombre'} reference dict)
+            # can't equal any ingredient name
+            return None
     
     def exists_in_category(self, nombre: str, categoria: str) -> bool:
         """
@@ -232,12 +324,8 @@ class IngredientCollection(BaseCollection):
             categories = collection.get_categories()
             # ['Pan', 'Salchicha', 'Toppings', 'Salsa', 'Acompañante']
         """
-        categories = set()
-        
-        for entity in self._items.values():
-            categories.add(entity.entity_type)
-        
-        return sorted(list(categories))
+        self._ensure_indexes()
+        return sorted(self._by_category)
     
     def count_by_category(self, categoria: str) -> int:
         """
@@ -253,7 +341,8 @@ class IngredientCollection(BaseCollection):
             num_panes = collection.count_by_category('Pan')
             print(f"Hay {num_panes} tipos de pan")
         """
-        return len(self.get_by_category(categoria))
+        self._ensure_indexes()
+        return len(self._by_category.get(categoria.capitalize(), ()))
     
     def get_category_stats(self) -> Dict[str, int]:
         """
@@ -9,35 +9,20 @@ Author: Rafael Correa
 Date: November 13, 2025
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Tuple
 
 
-class Entity:
+class EntityBase:
     """
-    generic base class for any domain entity.
+    Shared core of every entity: serialization, validation hook and identity.
     
-    This class can represent any business object by accepting dynamic properties
-    through **kwargs. Properties are set as real attributes (not dict lookup),
-    allowing natural access like entity.property_name.
+    Declares no slots of its own, so the classes generated by the entity
+    factory (which inherit from it) keep every field in __slots__ and have
+    no per-instance __dict__.
     
     """
     
-    def __init__(self, id: str, entity_type: str, **kwargs):
-        """
-        Initialize entity with core fields and dynamic properties.
-        
-        Args:
-            id: Unique identifier (UUID)
-            entity_type: Type/category of entity (e.g., 'Pan', 'HotDog', 'Dog')
-            **kwargs: Dynamic properties specific to this entity type
-        
-        """
-        self.id = id
-        self.entity_type = entity_type
-        
-        # Set all additional properties as real attributes
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+    __slots__ = ()
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -52,12 +37,26 @@ class Entity:
         """
         return {
             key: value 
-            for key, value in self.__dict__.items() 
+            for key, value in self._attribute_items() 
             if not key.startswith('_') and not callable(value)
         }
     
+    def _attribute_items(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield (name, value) for every attribute set on this instance.
+        
+        Generated (slotted dataclass) entities are read field by field, in
+        field order; anything in an instance __dict__ (Entity, or subclasses
+        without __slots__) follows.
+        """
+        fields = getattr(type(self), '__dataclass_fields__', None)
+        if fields is not None:
+            for key in fields:
+                yield key, getattr(self, key)
+        yield from getattr(self, '__dict__', {}).items()
+    
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Entity':
+    def from_dict(cls, data: Dict[str, Any]) -> 'EntityBase':
         """
         Create entity instance from dictionary.
         
@@ -99,7 +98,7 @@ class Entity:
         """
         attrs = ', '.join(
             f"{k}='{v}'" if isinstance(v, str) else f"{k}={v}"
-            for k, v in self.__dict__.items()
+            for k, v in self._attribute_items()
         )
         return f"{self.__class__.__name__}({attrs})"
     
@@ -116,7 +115,7 @@ class Entity:
             True if entities have same ID
         
         """
-        if not isinstance(other, Entity):
+        if not isinstance(other, EntityBase):
             return False
         return self.id == other.id
     
@@ -129,4 +128,35 @@ class Entity:
         Returns:
             Hash value based on ID
         """
-        return hash(self.id)
\ No newline at end of file
+        return hash(self.id)
+
+
+class Entity(EntityBase):
+    """
+    generic base class for any domain entity.
+    
+    This class can represent any business object by accepting dynamic properties
+    through **kwargs. Properties are set as real attributes (not dict lookup),
+    allowing natural access like entity.property_name.
+    
+    Unlike EntityBase it keeps a per-instance __dict__, so it can be used on
+    its own without a generated class.
+    
+    """
+    
+    def __init__(self, id: str, entity_type: str, **kwargs):
+        """
+        Initialize entity with core fields and dynamic properties.
+        
+        Args:
+            id: Unique identifier (UUID)
+            entity_type: Type/category of entity (e.g., 'Pan', 'HotDog', 'Dog')
+            **kwargs: Dynamic properties specific to this entity type
+        
+        """
+        self.id = id
+        self.entity_type = entity_type
+        
+        # Set all additional properties as real attributes
+        for key, value in kwargs.items():
+            setattr(self, key, value)
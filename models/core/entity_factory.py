@@ -11,15 +11,37 @@ Date: November 13, 2025
 
 from dataclasses import make_dataclass
 from typing import Any, Dict, List, Type
-from .base_entity import Entity
+from .base_entity import EntityBase
 from .method_registry import MethodRegistry
 
 
+def _slots_for(base_class: Type, field_names: List[str]) -> tuple:
+    """
+    Return the __slots__ a generated class needs on top of base_class.
+    
+    Attributes already slotted by a generated base (e.g. Ingredient) are
+    skipped, so each value is stored exactly once per instance.
+    
+    Args:
+        base_class: Class the generated class will inherit from
+        field_names: All field names of the generated class
+    
+    Returns:
+        Tuple of new slot names, in field order
+    """
+    inherited = {
+        name
+        for klass in base_class.__mro__
+        for name in klass.__dict__.get('__slots__', ())
+    }
+    return tuple(dict.fromkeys(name for name in field_names if name not in inherited))
+
+
 def create_entity_class(
     class_name: str,
     entity_type: str,
     properties: List[str],
-    base_class: Type = Entity
+    base_class: Type = EntityBase
 ) -> Type:
     """
     Create a dynamic entity class with registered methods and validators.
@@ -32,7 +54,7 @@ def create_entity_class(
         class_name: Name for the generated class (e.g., 'Pan', 'HotDog')
         entity_type: Entity type identifier used for method lookup in registry
         properties: List of property names this entity should have
-        base_class: Base class to inherit from (default: Entity)
+        base_class: Base class to inherit from (default: EntityBase)
     
     Returns:
         Dynamically generated class with injected methods and validators
@@ -47,11 +69,13 @@ def create_entity_class(
     # Add dynamic properties (all typed as Any for flexibility)
     fields.extend([(prop, Any) for prop in properties])
     
-    # Generate the class using make_dataclass
+    # Generate the class using make_dataclass; fields live in __slots__, so
+    # instances never allocate a per-instance __dict__
     DynamicClass = make_dataclass(
         class_name,
         fields,
         bases=(base_class,),
+        namespace={'__slots__': _slots_for(base_class, [name for name, _ in fields])},
         frozen=False  # Allow modification after creation
     )
     
@@ -75,7 +99,7 @@ def create_entity_class(
                 ValueError: If any validation fails
             """
             # Call base class validate if it exists
-            if hasattr(base_class, 'validate') and base_class != Entity:
+            if hasattr(base_class, 'validate') and base_class != EntityBase:
                 base_class.validate(self)
             
             # Then run the entity-specific composed validator
@@ -89,7 +113,7 @@ def create_entity_class(
 def create_base_class(
     class_name: str,
     common_properties: List[str],
-    base_class: Type = Entity
+    base_class: Type = EntityBase
 ) -> Type:
     """
     Create a base class with common properties and validators.
@@ -101,7 +125,7 @@ def create_base_class(
     Args:
         class_name: Name for the base class (e.g., 'Ingredient')
         common_properties: Properties common to all subclasses
-        base_class: Base class to inherit from (default: Entity)
+        base_class: Base class to inherit from (default: EntityBase)
     
     Returns:
         Base class with common properties and injected validator
@@ -115,6 +139,7 @@ def create_base_class(
         class_name,
         fields,
         bases=(base_class,),
+        namespace={'__slots__': _slots_for(base_class, [name for name, _ in fields])},
         frozen=False
     )
     
@@ -134,7 +159,7 @@ def create_base_class(
                 ValueError: If any validation fails
             """
             # Call parent class validate if it exists
-            if hasattr(base_class, 'validate') and base_class != Entity:
+            if hasattr(base_class, 'validate') and base_class != EntityBase:
                 base_class.validate(self)
             
             # Then run the base class-specific composed validator
@@ -147,7 +172,7 @@ def create_base_class(
 
 def create_entities_from_schemas(
     schemas: Dict[str, List[str]],
-    base_class: Type = Entity
+    base_class: Type = EntityBase
 ) -> Dict[str, Type]:
     """
     Create multiple entity classes from a schemas dictionary.
@@ -161,7 +186,7 @@ def create_entities_from_schemas(
                      'Pan': ['tipo', 'tamaño', 'unidad'],
                      'HotDog': ['pan_id', 'salchicha_id']
                  }
-        base_class: Base class to inherit from (default: Entity)
+        base_class: Base class to inherit from (default: EntityBase)
     
     Returns:
         Dictionary mapping class names to generated classes
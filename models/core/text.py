@@ -0,0 +1,73 @@
+"""
+Accent stripping shared by key normalization and schema inference.
+
+Author: Rafael Correa
+Date: November 17, 2025
+"""
+
+import unicodedata
+from typing import Dict
+
+
+def _strip_accents_nfd(text: str) -> str:
+    """Remove accents via NFD decomposition (handles any unicode input)."""
+    # Decompose unicode characters (á → a + combining acute accent)
+    decomposed = unicodedata.normalize('NFD', text)
+    
+    # Remove combining characters (accents)
+    return ''.join(
+        char for char in decomposed
+        if unicodedata.category(char) != 'Mn'
+    )
+
+
+def _build_accent_table() -> Dict[int, str]:
+    """
+    Build a str.translate table for accented Latin letters (U+00C0-U+017F).
+    
+    Each entry is derived from _strip_accents_nfd, so translating is exactly
+    equivalent to the NFD path for every character the table covers.
+    """
+    table = {}
+    for codepoint in range(0x00C0, 0x0180):
+        char = chr(codepoint)
+        stripped = _strip_accents_nfd(char)
+        if stripped != char:
+            table[codepoint] = stripped
+    
+    # ñ and Ñ are replaced explicitly
+    table[ord('ñ')] = 'n'
+    table[ord('Ñ')] = 'n'
+    return table
+
+
+_ACCENT_TABLE = _build_accent_table()
+
+
+def strip_accents(text: str) -> str:
+    """
+    Remove accents and ñ from a string, keeping its case otherwise.
+    
+    Accented Latin letters go through a single precomputed str.translate
+    pass; anything the table doesn't cover falls back to full NFD
+    decomposition. Note that ñ and Ñ both become lowercase 'n'.
+    
+    Args:
+        text: String to strip
+    
+    Returns:
+        String without accents or ñ
+    
+    Examples:
+        >>> strip_accents('Categoría')
+        'Categoria'
+        >>> strip_accents('Tamaño')
+        'Tamano'
+    """
+    normalized = text.translate(_ACCENT_TABLE)
+    
+    # Characters outside the table fall back to full NFD decomposition
+    if not normalized.isascii():
+        normalized = _strip_accents_nfd(normalized)
+    
+    return normalized
@@ -1,3 +1,5 @@
+import functools
+
 from models.schemas.hotdog_schemas import get_hotdog_schemas
 from models.core.entity_factory import create_base_class, create_entities_from_schemas
 
@@ -11,7 +13,25 @@ def create_hotdog_entities(raw_data=None):
     Returns:
         Dictionary mapping entity type names to their classes.
         Example: {'HotDog': HotDogClass}
+    
+    Note:
+        Fallback classes (raw_data=None) are built once and reused; call
+        models.clear_entity_caches() to force them to be regenerated.
     """
+    if raw_data is None:
+        # Fresh dict per call so callers can't alter the cached mapping
+        return dict(_fallback_hotdog_entities())
+    return _build_hotdog_entities(raw_data)
+
+
+@functools.lru_cache(maxsize=1)
+def _fallback_hotdog_entities():
+    """Build the fallback hotdog classes once (see create_hotdog_entities)."""
+    return _build_hotdog_entities(None)
+
+
+def _build_hotdog_entities(raw_data):
+    """Infer (or fall back to) the schemas and generate the hotdog classes."""
     import models.plugins.hotdogs
     schemas = get_hotdog_schemas(raw_data)
     entities = create_entities_from_schemas(schemas)
@@ -1,3 +1,5 @@
+import functools
+
 from models.schemas.ingredient_schemas import get_ingredient_schemas
 from models.core.entity_factory import create_base_class, create_entities_from_schemas
 
@@ -14,7 +16,25 @@ def create_ingredient_entities(raw_data=None):
         Dictionary mapping entity type names to their classes.
         Includes 'Ingredient' (base class) and all specific types.
         Example: {'Ingredient': IngredientClass, 'Pan': PanClass, ...}
+    
+    Note:
+        Fallback classes (raw_data=None) are built once and reused; call
+        models.clear_entity_caches() to force them to be regenerated.
     """
+    if raw_data is None:
+        # Fresh dict per call so callers can't alter the cached mapping
+        return dict(_fallback_ingredient_entities())
+    return _build_ingredient_entities(raw_data)
+
+
+@functools.lru_cache(maxsize=1)
+def _fallback_ingredient_entities():
+    """Build the fallback ingredient classes once (see create_ingredient_entities)."""
+    return _build_ingredient_entities(None)
+
+
+def _build_ingredient_entities(raw_data):
+    """Infer (or fall back to) the schemas and generate the ingredient classes."""
     import models.plugins.ingredients 
     
     # Infer or use fallback schemas
@@ -7,6 +7,7 @@ Author: Rafael Correa
 Date: November 16, 2025
 """
 
+import functools
 from typing import Dict, Type
 from models.core.entity_factory import create_entities_from_schemas
 from models.schemas.venta_schemas import get_venta_schemas
@@ -42,7 +43,18 @@ def create_venta_entities() -> Dict[str, Type]:
         >>> venta.validate()  # Runs all registered validators
         >>> print(venta.fecha)
         2024-11-16T14:30:00
+    
+    Note:
+        The schemas never change, so the classes are built once and reused;
+        call models.clear_entity_caches() to force them to be regenerated.
     """
+    # Fresh dict per call so callers can't alter the cached mapping
+    return dict(_build_venta_entities())
+
+
+@functools.lru_cache(maxsize=1)
+def _build_venta_entities() -> Dict[str, Type]:
+    """Generate the Venta classes (memoized, see create_venta_entities)."""
     # ─── STEP 1: Import plugins (registers validators) ───
     import models.plugins.ventas
     
@@ -51,7 +63,7 @@ def create_venta_entities() -> Dict[str, Type]:
     # schemas = {'Venta': ['fecha', 'items']}
     
     # ─── STEP 3: Create entity classes ───
-    # Base class is Entity (no intermediate base like Ingredient)
+    # Base class is EntityBase (no intermediate base like Ingredient)
     entities = create_entities_from_schemas(schemas)
     # entities = {'Venta': VentaClass}
     
@@ -10,13 +10,32 @@ Date: November 13, 2025
 from models.core.method_registry import MethodRegistry
 
 
+# Distinguishes a missing tamano from one explicitly set to None
+_MISSING = object()
+
+
 # Register method to compare sizes with Pan
 # Note: Uses normalized key 'tamano' (no accent)
-MethodRegistry.register_method(
-    'Salchicha',
-    'matches_size',
-    lambda self, other: hasattr(self, 'tamano') and hasattr(other, 'tamano') and self.tamano == other.tamano
-)
+def matches_size(self, other) -> bool:
+    """
+    Check whether this sausage has the same tamano as other (usually a Pan).
+    
+    A plain attribute comparison: one getattr per side, no hasattr()
+    pre-checks. Compiling it (e.g. Numba) would cost more in call dispatch
+    than the comparison itself.
+    
+    Args:
+        other: Entity to compare with
+    
+    Returns:
+        True if both have a tamano attribute and the values are equal
+        (including both being None)
+    """
+    tamano = getattr(self, 'tamano', _MISSING)
+    return tamano is not _MISSING and tamano == getattr(other, 'tamano', _MISSING)
+
+
+MethodRegistry.register_method('Salchicha', 'matches_size', matches_size)
 
 
 # Register validators
@@ -10,7 +10,8 @@ Date: November 13, 2025
 """
 
 from typing import Dict, List, Any, Optional, Tuple
-import unicodedata
+
+from models.core.text import strip_accents
 
 
 def normalize_string(text: str) -> str:
@@ -39,17 +40,12 @@ def normalize_string(text: str) -> str:
     if not isinstance(text, str):
         return text
     
-    # Replace ñ and Ñ explicitly (not handled by NFD decomposition)
-    normalized = text.replace('ñ', 'n').replace('Ñ', 'n')
-    
-    # Decompose unicode characters (á → a + combining acute accent)
-    normalized = unicodedata.normalize('NFD', normalized)
+    # Plain ASCII strings (the common case) only need lowercasing
+    if text.isascii():
+        return text.lower()
     
-    # Remove combining characters (accents)
-    normalized = ''.join(
-        char for char in normalized 
-        if unicodedata.category(char) != 'Mn'
-    )
+    # Single C-level pass over the precomputed table
+    normalized = strip_accents(text)
     
     # Convert to lowercase
     return normalized.lower()
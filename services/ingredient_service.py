@@ -61,11 +61,8 @@ class IngredientService:
         Example:
             >>> panes_blancos = IngredientService.list_by_type(handler, 'Pan', 'blanco')
         """
-        # Get all ingredients in category
-        ingredients = handler.ingredientes.get_by_category(categoria)
-        
-        # Filter by type
-        return [ing for ing in ingredients if hasattr(ing, 'tipo') and ing.tipo == tipo]
+        # Indexed by (category, tipo) in the collection: no per-call filtering
+        return handler.ingredientes.get_by_type(categoria, tipo)
     
     @staticmethod
     def add_ingredient(
@@ -412,18 +409,18 @@ class IngredientService:
         return result
     
     @staticmethod
-    def update_stock(
+    def set_stock(
         handler: DataHandler,
         ingrediente_id: str,
-        cantidad: int
+        stock: int
     ) -> Dict[str, Any]:
         """
-        Update stock for an ingredient (add or subtract).
+        Set the stock of an ingredient to an absolute value.
         
         Args:
             handler: DataHandler instance
             ingrediente_id: ID of the ingredient
-            cantidad: Quantity to add (positive) or subtract (negative)
+            stock: New stock value (must be non-negative)
         
         Returns:
             Dict with:
@@ -433,10 +430,8 @@ class IngredientService:
                 - 'error': Error message if failed
         
         Example:
-            >>> # Add 50 units
-            >>> result = IngredientService.update_stock(handler, 'pan_id', 50)
-            >>> # Subtract 10 units
-            >>> result = IngredientService.update_stock(handler, 'pan_id', -10)
+            >>> # Run out of an ingredient
+            >>> result = IngredientService.set_stock(handler, 'pan_id', 0)
         """
         try:
             ingredient = handler.ingredientes.get(ingrediente_id)
@@ -447,22 +442,18 @@ class IngredientService:
                     'error': f"Ingrediente con ID '{ingrediente_id}' no encontrado"
                 }
             
-            # Get current stock
             stock_anterior = getattr(ingredient, 'stock', 0)
             
-            # Calculate new stock
-            stock_nuevo = stock_anterior + cantidad
-            
             # Validate non-negative stock
-            if stock_nuevo < 0:
+            if stock < 0:
                 return {
                     'exito': False,
                     'stock_anterior': stock_anterior,
-                    'error': f"Stock no puede ser negativo. Stock actual: {stock_anterior}, intentó restar: {abs(cantidad)}"
+                    'error': f"Stock no puede ser negativo: {stock}"
                 }
             
             # Update stock
-            setattr(ingredient, 'stock', stock_nuevo)
+            setattr(ingredient, 'stock', stock)
             
             # Update in collection (marks dirty)
             handler.ingredientes.update(ingredient)
@@ -470,7 +461,7 @@ class IngredientService:
             return {
                 'exito': True,
                 'stock_anterior': stock_anterior,
-                'stock_nuevo': stock_nuevo
+                'stock_nuevo': stock
             }
             
         except Exception as e:
@@ -479,10 +470,86 @@ class IngredientService:
                 'error': f"Error al actualizar stock: {str(e)}"
             }
     
+    @staticmethod
+    def update_stock(
+        handler: DataHandler,
+        ingrediente_id: str,
+        cantidad: int
+    ) -> Dict[str, Any]:
+        """
+        Update stock for an ingredient (add or subtract).
+        
+        Computes the new value and delegates the write to set_stock().
+        
+        Args:
+            handler: DataHandler instance
+            ingrediente_id: ID of the ingredient
+            cantidad: Quantity to add (positive) or subtract (negative)
+        
+        Returns:
+            Dict with:
+                - 'exito': bool indicating success
+                - 'stock_anterior': Previous stock value
+                - 'stock_nuevo': New stock value
+                - 'error': Error message if failed
+        
+        Example:
+            >>> # Add 50 units
+            >>> result = IngredientService.update_stock(handler, 'pan_id', 50)
+            >>> # Subtract 10 units
+            >>> result = IngredientService.update_stock(handler, 'pan_id', -10)
+        """
+        try:
+            # Get current stock
+            stock_anterior = IngredientService.get_stock(handler, ingrediente_id)
+            
+            if stock_anterior is None:
+                return {
+                    'exito': False,
+                    'error': f"Ingrediente con ID '{ingrediente_id}' no encontrado"
+                }
+            
+            # Calculate new stock
+            stock_nuevo = stock_anterior + cantidad
+            
+            # Reject here so the message names the subtraction
+            if stock_nuevo < 0:
+                return {
+                    'exito': False,
+                    'stock_anterior': stock_anterior,
+                    'error': f"Stock no puede ser negativo. Stock actual: {stock_anterior}, intentó restar: {abs(cantidad)}"
+                }
+            
+        except Exception as e:
+            return {
+                'exito': False,
+                'error': f"Error al actualizar stock: {str(e)}"
+            }
+        
+        return IngredientService.set_stock(handler, ingrediente_id, stock_nuevo)
+    
+    @staticmethod
+    def _availability_result(faltantes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build the check_hotdog_availability() result for a list of shortages.
+        
+        Args:
+            faltantes: Missing ingredient entries, in check order
+        
+        Returns:
+            Dict with 'disponible', 'faltantes' and 'faltantes_por_nombre'
+        """
+        return {
+            'disponible': not faltantes,
+            'faltantes': faltantes,
+            'faltantes_por_nombre': {f['ingrediente']: f for f in faltantes}
+        }
+    
     @staticmethod
     def check_hotdog_availability(
         handler: DataHandler,
-        hotdog_id: str
+        hotdog_id: str,
+        detailed: bool = True
     ) -> Dict[str, Any]:
         """
         Check if there's sufficient inventory to make a hot dog.
@@ -490,15 +557,21 @@ class IngredientService:
         Args:
             handler: DataHandler instance
             hotdog_id: ID of the hot dog to check
+            detailed: If True (default), check every ingredient and report all
+                     of the missing ones. If False, stop at the first missing
+                     ingredient (for callers that only read 'disponible')
         
         Returns:
             Dict with:
                 - 'disponible': bool indicating if all ingredients are available
-                - 'faltantes': List of dicts with missing ingredients:
+                - 'faltantes': List of dicts with missing ingredients (only the
+                  first one when detailed=False):
                     - 'ingrediente': Ingredient name
                     - 'categoria': Ingredient category
                     - 'necesita': Quantity needed (always 1)
                     - 'disponible': Current stock
+                - 'faltantes_por_nombre': The same entries keyed by ingredient
+                  name, for membership checks without scanning the list
                 - 'error': Error message if hot dog not found
         
         Example:
@@ -517,6 +590,7 @@ class IngredientService:
                 return {
                     'disponible': False,
                     'faltantes': [],
+                    'faltantes_por_nombre': {},
                     'error': f"Hot dog con ID '{hotdog_id}' no encontrado"
                 }
             
@@ -539,6 +613,8 @@ class IngredientService:
                             'necesita': 1,
                             'disponible': stock
                         })
+                        if not detailed:
+                            return IngredientService._availability_result(faltantes)
             
             # Check salchicha
             if hasattr(hotdog, 'salchicha') and hotdog.salchicha:
@@ -556,6 +632,8 @@ class IngredientService:
                             'necesita': 1,
                             'disponible': stock
                         })
+                        if not detailed:
+                            return IngredientService._availability_result(faltantes)
             
             # Check toppings
             if hasattr(hotdog, 'toppings') and hotdog.toppings:
@@ -573,6 +651,8 @@ class IngredientService:
                                 'necesita': 1,
                                 'disponible': stock
                             })
+                            if not detailed:
+                                return IngredientService._availability_result(faltantes)
             
             # Check salsas
             if hasattr(hotdog, 'salsas') and hotdog.salsas:
@@ -590,6 +670,8 @@ class IngredientService:
                                 'necesita': 1,
                                 'disponible': stock
                             })
+                            if not detailed:
+                                return IngredientService._availability_result(faltantes)
             
             # Check acompanante
             if hasattr(hotdog, 'acompanante') and hotdog.acompanante:
@@ -607,15 +689,15 @@ class IngredientService:
                             'necesita': 1,
                             'disponible': stock
                         })
+                        if not detailed:
+                            return IngredientService._availability_result(faltantes)
             
-            return {
-                'disponible': len(faltantes) == 0,
-                'faltantes': faltantes
-            }
+            return IngredientService._availability_result(faltantes)
             
         except Exception as e:
             return {
                 'disponible': False,
                 'faltantes': [],
+                'faltantes_por_nombre': {},
                 'error': f"Error al verificar disponibilidad: {str(e)}"
             }
@@ -110,6 +110,7 @@ class MenuService:
             Dict with:
                 - disponible: bool
                 - faltantes: list of dicts with missing ingredients (if any)
+                - faltantes_por_nombre: same entries keyed by ingredient name
                 - error: str (if hotdog not found)
         
         Example:
@@ -349,7 +350,10 @@ class MenuService:
                 return {'exito': False, 'error': f"Hot dog con ID '{hotdog_id}' no encontrado"}
             
             # ─── VERIFICAR DISPONIBILIDAD DE INVENTARIO ───
-            availability = IngredientService.check_hotdog_availability(handler, hotdog_id)
+            # Solo se usa 'disponible': basta con el primer faltante
+            availability = IngredientService.check_hotdog_availability(
+                handler, hotdog_id, detailed=False
+            )
             
             # Si hay error en la verificación (ej: hotdog no existe), retornar error
             if 'error' in availability:
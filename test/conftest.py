@@ -0,0 +1,306 @@
+"""
+Shared pytest fixtures for the test suite.
+
+GitHub payloads are served once per session and shared across tests; tests
+that need to mutate data take a deep copy via the fresh_* fixtures.
+Copies go through a pickle round-trip, which is several times faster than
+copy.deepcopy on these plain dict/list payloads.
+
+By default the payloads are replayed from recorded files in
+test/fixtures/github/, so no network is needed. HDM_GITHUB_MODE selects:
+    replay  Serve the recorded files (default)
+    live    Fetch from GitHub (skipped when offline)
+    record  Fetch from GitHub and overwrite the recorded files
+
+Author: Rafael Correa
+Date: November 17, 2025
+"""
+
+import glob
+import hashlib
+import os
+import pickle
+import shutil
+import socket
+
+import pytest
+
+from clients.external_sources.external_source_client import ExternalSourceClient
+from clients.external_sources.github_client import GitHubClient
+from clients.external_sources.frozen_source import FrozenSource
+from clients.data_source_client import DataSourceClient
+from clients import json_codec
+from clients.adapters import (
+    CachingAdapter,
+    IDAdapter,
+    KeyNormalizationAdapter,
+    StockInitializationAdapter,
+    IngredientReferenceAdapter
+)
+from clients.id_processors import (
+    process_grouped_structure_ids,
+    process_flat_structure_ids
+)
+import config
+
+
+def _github_reachable() -> bool:
+    """Probe GitHub's raw content host once with a short connect timeout."""
+    try:
+        socket.create_connection(('raw.githubusercontent.com', 443), timeout=1.0).close()
+        return True
+    except OSError:
+        return False
+
+
+GITHUB_MODE = os.environ.get('HDM_GITHUB_MODE', 'replay')
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'github')
+RECORDED_FILES = ('ingredientes.json', 'menu.json')
+
+
+def _fresh_copy(data):
+    """Deep copy plain JSON data via a pickle round-trip (faster than deepcopy)."""
+    return pickle.loads(pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+
+
+def _load_recorded() -> FrozenSource:
+    """Load the recorded GitHub payloads into an in-memory source."""
+    payloads = {}
+    for filename in RECORDED_FILES:
+        with open(os.path.join(FIXTURES_DIR, filename), 'rb') as f:
+            payloads[filename] = json_codec.loads(f.read())
+    return FrozenSource(payloads)
+
+
+def _record(client: ExternalSourceClient) -> None:
+    """Fetch every recorded file from GitHub and overwrite its fixture."""
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    for filename in RECORDED_FILES:
+        data = client.fetch_data(filename)
+        path = os.path.join(FIXTURES_DIR, filename)
+        
+        # Every xdist worker records: write-then-rename so none reads a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(json_codec.dumps(data) + b'\n')
+        os.replace(tmp_path, path)
+        print(f"📼 Recorded {filename}")
+
+
+@pytest.fixture(scope="session")
+def github_client(request):
+    """
+    Source of raw GitHub payloads for the whole run.
+    
+    Replays recorded files by default; in live/record mode it is the
+    `live_github_client` (skipped when GitHub is unreachable).
+    """
+    if GITHUB_MODE == 'replay':
+        return _load_recorded()
+    
+    client = request.getfixturevalue('live_github_client')
+    
+    if GITHUB_MODE == 'record':
+        _record(client)
+    
+    return client
+
+
+@pytest.fixture(scope="session")
+def live_github_client():
+    """
+    The real GitHub repository, whatever HDM_GITHUB_MODE says.
+    
+    A single GitHubClient (one pooled HTTP session) behind a CachingAdapter,
+    so each file crosses the network once per session. Skipped when GitHub
+    is unreachable.
+    """
+    if not _github_reachable():
+        pytest.skip("GitHub unreachable (offline)")
+    
+    client = CachingAdapter(GitHubClient(
+        owner=config.GITHUB_OWNER,
+        repo=config.GITHUB_REPO,
+        branch=config.GITHUB_BRANCH,
+        cache_dir=config.HTTP_CACHE_DIR
+    ))
+    
+    # Both files are downloaded concurrently, once, before any test runs
+    client.prefetch(RECORDED_FILES)
+    return client
+
+
+@pytest.fixture(scope="session")
+def raw_payloads(github_client):
+    """All raw GitHub files, fetched concurrently once per session."""
+    return github_client.fetch_many(RECORDED_FILES)
+
+
+@pytest.fixture(scope="session")
+def raw_ingredientes(raw_payloads):
+    """Raw ingredientes.json (GROUPED structure), fetched once per session."""
+    return raw_payloads["ingredientes.json"]
+
+
+@pytest.fixture(scope="session")
+def raw_menu(raw_payloads):
+    """Raw menu.json (FLAT structure), fetched once per session."""
+    return raw_payloads["menu.json"]
+
+
+@pytest.fixture(scope="session")
+def ingredientes_with_ids(raw_ingredientes):
+    """Ingredientes with stable IDs (the processor leaves the raw payload intact)."""
+    data, _ = process_grouped_structure_ids(raw_ingredientes)
+    return data
+
+
+@pytest.fixture(scope="session")
+def menu_with_ids(raw_menu):
+    """Menu with stable IDs (the processor leaves the raw payload intact)."""
+    data, _ = process_flat_structure_ids(raw_menu)
+    return data
+
+
+@pytest.fixture
+def fresh_raw_ingredientes(raw_ingredientes):
+    """Per-test deep copy of raw ingredientes, safe to mutate."""
+    return _fresh_copy(raw_ingredientes)
+
+
+@pytest.fixture
+def fresh_raw_menu(raw_menu):
+    """Per-test deep copy of the raw menu, safe to mutate."""
+    return _fresh_copy(raw_menu)
+
+
+# Initial stock used by the shared ingredientes chain
+DEFAULT_STOCK = 50
+STOCK_BY_CATEGORY = {
+    'pan': 100,
+    'salchicha': 75,
+    'toppings': 200,
+    'salsa': 150,
+    'acompañante': 80
+}
+
+
+@pytest.fixture(scope="session")
+def stock_by_category():
+    """Initial stock per category configured on the shared ingredientes chain."""
+    return dict(STOCK_BY_CATEGORY)
+
+
+@pytest.fixture(scope="session")
+def sources(github_client):
+    """
+    Build the full ingredientes and menu adapter chains once per session.
+    
+    Both chains sit behind a CachingAdapter, so tests 5-7 share a single
+    pipeline execution per file and each still gets its own copy to mutate.
+    
+    Returns:
+        Tuple of (ingredientes_source, menu_source)
+    """
+    # Ingredientes: GitHub → IDs → KeyNorm → Stock
+    ingredientes_source = CachingAdapter(StockInitializationAdapter(
+        KeyNormalizationAdapter(
+            IDAdapter(github_client, process_grouped_structure_ids)
+        ),
+        default_stock=DEFAULT_STOCK,
+        stock_by_category=STOCK_BY_CATEGORY
+    ))
+    
+    # Menu: GitHub → IDs → KeyNorm → IngredientRef
+    menu_source = CachingAdapter(IngredientReferenceAdapter(
+        KeyNormalizationAdapter(
+            IDAdapter(github_client, process_flat_structure_ids)
+        ),
+        ingredientes_source
+    ))
+    
+    return ingredientes_source, menu_source
+
+
+# Everything the processed payloads depend on in replay mode: the recorded
+# inputs, the code that transforms them and the stock configuration
+_PIPELINE_FILES = (
+    [os.path.join(FIXTURES_DIR, filename) for filename in RECORDED_FILES]
+    + sorted(glob.glob(os.path.join(ROOT_DIR, 'clients', 'adapters', '*.py')))
+    + [os.path.join(ROOT_DIR, 'clients', 'id_processors.py')]
+)
+
+
+def _pipeline_key() -> str:
+    """Digest of the replay pipeline inputs; changes whenever its output could."""
+    digest = hashlib.sha256(repr((DEFAULT_STOCK, sorted(STOCK_BY_CATEGORY.items()))).encode())
+    for path in _PIPELINE_FILES:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+@pytest.fixture(scope="session")
+def processed_payloads(request):
+    """
+    Output of the full adapter chains: {'ingredientes': ..., 'menu': ...}.
+    
+    In replay mode the result is pickled into pytest's cache directory
+    (.pytest_cache) under a digest of the recorded files, the adapter code
+    and the stock configuration, so later runs skip the chains entirely.
+    Live/record runs, or runs with the cache plugin disabled
+    (-p no:cacheprovider), always execute the chains.
+    
+    For tests that only need the resulting data; adapter tests should use
+    `sources`, which always runs the real chains.
+    """
+    cache = getattr(request.config, 'cache', None)
+    cache_path = None
+    
+    if GITHUB_MODE == 'replay' and cache is not None:
+        cache_path = cache.mkdir('hdm_processed_payloads') / f"{_pipeline_key()}.pkl"
+        if cache_path.exists():
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+    
+    ingredientes_source, menu_source = request.getfixturevalue('sources')
+    payloads = {
+        'ingredientes': ingredientes_source.fetch_data('ingredientes.json'),
+        'menu': menu_source.fetch_data('menu.json')
+    }
+    
+    if cache_path is not None:
+        # Write-then-rename, so a concurrent xdist worker never reads a partial pickle
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(payloads, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    
+    return payloads
+
+
+@pytest.fixture(scope="session")
+def baseline_data_dir(processed_payloads, tmp_path_factory):
+    """
+    Data directory with the processed ingredientes, menu and an empty ventas.
+    
+    Written once per session (per xdist worker) and never modified: tests
+    that need a DataSourceClient copy it with `fresh_data_dir`.
+    """
+    baseline = tmp_path_factory.mktemp("baseline")
+    data_source = DataSourceClient(data_dir=str(baseline))
+    data_source.initialize({
+        name: FrozenSource({f"{name}.json": data})
+        for name, data in processed_payloads.items()
+    }, force_external=True)
+    
+    # Ventas has no external source (local file only, as in app.py)
+    data_source.save('ventas', [])
+    return baseline
+
+
+@pytest.fixture
+def fresh_data_dir(baseline_data_dir, tmp_path):
+    """Per-test copy of the baseline data directory, safe to write to."""
+    return shutil.copytree(baseline_data_dir, tmp_path / "data")
@@ -0,0 +1,90 @@
+"""
+Tests for the stock, ingredient reference and caching adapters.
+
+Tests 5 and 6 run over the shared full adapter chains (the `sources`
+fixture in conftest.py).
+
+Author: Rafael Correa
+Date: November 17, 2025
+"""
+
+from clients.external_sources.frozen_source import FrozenSource
+from clients.adapters import CachingAdapter
+
+
+def test_5_stock_initialization_adapter(sources, stock_by_category):
+    """Test 5: Stock Initialization Adapter adds stock field."""
+    # Chain: GitHub → IDs → KeyNorm → Stock
+    adapter, _ = sources
+    
+    ingredientes = adapter.fetch_data("ingredientes.json")
+    
+    # Verify stock was added
+    for group in ingredientes:
+        categoria = group['categoria']
+        opciones = group['opciones']
+        
+        missing = [item['nombre'] for item in opciones if 'stock' not in item]
+        assert not missing, f"Items without stock in {categoria}: {missing}"
+        
+        # Verify correct values
+        expected = stock_by_category.get(categoria.lower(), 50)
+        wrong = [item['nombre'] for item in opciones if item['stock'] != expected]
+        assert not wrong, f"Items in {categoria} without stock {expected}: {wrong}"
+
+
+def test_6_ingredient_reference_adapter(sources):
+    """Test 6: Ingredient Reference Adapter converts names to {id, nombre} objects."""
+    # Menu chain: GitHub → IDs → KeyNorm → IngredientRef (over the shared ingredientes chain)
+    _, menu_adapter = sources
+    
+    menu = menu_adapter.fetch_data("menu.json")
+    
+    # Verify conversion
+    first_hotdog = menu[0]
+    
+    # Check pan
+    pan = first_hotdog['pan']
+    assert isinstance(pan, dict), "Pan should be an object"
+    assert 'id' in pan and 'nombre' in pan, "Pan should have id and nombre"
+    
+    # Check salchicha
+    salchicha = first_hotdog['salchicha']
+    assert isinstance(salchicha, dict), "Salchicha should be an object"
+    
+    # Check toppings (list)
+    if first_hotdog.get('toppings') and len(first_hotdog['toppings']) > 0:
+        topping = first_hotdog['toppings'][0]
+        assert isinstance(topping, dict), "Topping should be an object"
+
+
+class _CountingSource(FrozenSource):
+    """FrozenSource that counts how many fetches reach it."""
+    
+    def __init__(self, payloads):
+        super().__init__(payloads)
+        self.calls = 0
+    
+    def fetch_data(self, identifier, **kwargs):
+        self.calls += 1
+        return super().fetch_data(identifier, **kwargs)
+
+
+def test_10_caching_adapter(raw_menu):
+    """Test 10: Caching Adapter fetches each identifier once and hands out copies."""
+    upstream = _CountingSource({"menu.json": raw_menu})
+    cached = CachingAdapter(upstream)
+    
+    first = cached.fetch_data("menu.json")
+    first[0]['nombre'] = 'mutated'
+    second = cached.fetch_data("menu.json")
+    
+    assert upstream.calls == 1, "Second fetch should be served from the cache"
+    assert second == raw_menu, "Mutating a result should not poison the cache"
+    
+    cached.prefetch(["menu.json"])
+    assert upstream.calls == 1, "prefetch() should skip cached identifiers"
+    
+    cached.clear()
+    cached.fetch_many(["menu.json"] * 4)
+    assert upstream.calls == 2, "clear() should force one new fetch, shared by concurrent callers"
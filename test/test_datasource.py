@@ -1,52 +1,42 @@
 """
-Comprehensive test suite for DataSource and Adapter system.
+Test suite for the GitHub client and DataSourceClient.
 
-Tests the complete chain of adapters from GitHub to persisted local files,
-verifying that all transformations (IDs, key normalization, stock, and 
-ingredient references) work correctly and persist properly.
+Tests raw GitHub fetches (including ETag revalidation) and the complete chain
+of adapters persisted to local files and reloaded. IDs, key normalization and
+the individual adapters are covered in test_ids.py, test_normalization.py and
+test_adapters.py.
+
+Run with pytest (parallel with pytest-xdist):
+    pytest -n auto test/
+
+Tests report through pytest itself (use -v for per-test status); they do
+not print progress banners.
 
 Author: Rafael Correa
 Date: November 15, 2025
 """
 
-import sys
 import os
-import json
+import hashlib
 
-# Add project root to Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+import requests
 
 from clients.external_sources.github_client import GitHubClient
+from clients import json_codec
 from clients.data_source_client import DataSourceClient
-from clients.adapters import (
-    IDAdapter,
-    KeyNormalizationAdapter,
-    StockInitializationAdapter,
-    IngredientReferenceAdapter
-)
-from clients.id_processors import (
-    generate_stable_id,
-    process_grouped_structure_ids,
-    process_flat_structure_ids
-)
-import config
 
 
-def test_1_github_client_raw():
-    """Test 1: GitHub client fetches raw data without any transformations."""
-    print("\n" + "=" * 70)
-    print("🧪 Test 1: GitHub Client - Raw Data Fetch")
-    print("=" * 70)
-    
-    github = GitHubClient(
-        owner=config.GITHUB_OWNER,
-        repo=config.GITHUB_REPO,
-        branch=config.GITHUB_BRANCH
-    )
-    
-    # Fetch ingredientes
-    print("\n📥 Fetching ingredientes.json from GitHub...")
-    ingredientes = github.fetch_data("ingredientes.json")
+def _read_json(path):
+    """Read a JSON file in a single read and parse it from bytes."""
+    with open(path, 'rb') as f:
+        return json_codec.loads(f.read())
+
+
+def test_github_client_raw(raw_ingredientes, raw_menu):
+    """GitHub client fetches raw data without any transformations."""
+    # Fetch ingredientes (session fixture: one request per run)
+    ingredientes = raw_ingredientes
     
     assert isinstance(ingredientes, list), "Should return a list"
     assert len(ingredientes) > 0, "Should have data"
@@ -59,14 +49,8 @@ def test_1_github_client_raw():
     assert 'id' not in first_item, "Raw data should NOT have IDs"
     assert 'stock' not in first_item, "Raw data should NOT have stock"
     
-    print(f"✅ Fetched {len(ingredientes)} categories")
-    print(f"   First category: {first_group['Categoria']}")
-    print(f"   First item: {first_item['nombre']}")
-    print(f"   Keys are original (not normalized): {list(first_group.keys())}")
-    
     # Fetch menu
-    print("\n📥 Fetching menu.json from GitHub...")
-    menu = github.fetch_data("menu.json")
+    menu = raw_menu
     
     assert isinstance(menu, list), "Should return a list"
     assert len(menu) > 0, "Should have data"
@@ -75,274 +59,14 @@ def test_1_github_client_raw():
     # Some hotdogs might not have all fields, check if pan exists
     if 'pan' in first_hotdog:
         assert isinstance(first_hotdog['pan'], str), "Ingredients should be strings (not objects)"
-        print(f"✅ Fetched {len(menu)} hot dogs")
-        print(f"   First hotdog: {first_hotdog['nombre']}")
-        print(f"   Pan is string: '{first_hotdog['pan']}' (not object yet)")
-    else:
-        print(f"✅ Fetched {len(menu)} hot dogs")
-        print(f"   First hotdog: {first_hotdog['nombre']}")
-        print(f"   Note: This hotdog doesn't have 'pan' field (nullable)")
-    
-    print("\n✅ Test 1 PASSED: GitHub client works correctly\n")
-
-
-def test_2_stable_ids():
-    """Test 2: Stable ID generation is deterministic."""
-    print("\n" + "=" * 70)
-    print("🧪 Test 2: Stable ID Generation")
-    print("=" * 70)
-    
-    # Same input = same ID
-    id1 = generate_stable_id("simple", "Pan")
-    id2 = generate_stable_id("simple", "Pan")
-    assert id1 == id2, "Same input should produce same ID"
-    print(f"\n✅ Deterministic: Pan:simple → {id1}")
-    
-    # Different input = different ID
-    id_pan = generate_stable_id("simple", "Pan")
-    id_salsa = generate_stable_id("simple", "Salsa")
-    assert id_pan != id_salsa, "Different category should produce different ID"
-    print(f"✅ Category matters: Pan:simple ≠ Salsa:simple")
-    
-    # Valid UUID format
-    parts = id1.split('-')
-    assert len(parts) == 5, "Should be valid UUID format"
-    assert len(parts[0]) == 8, "UUID part 1 should be 8 chars"
-    print(f"✅ Valid UUID format: {id1}")
-    
-    print("\n✅ Test 2 PASSED: IDs are stable and deterministic\n")
-
-
-def test_3_id_adapter():
-    """Test 3: ID Adapter adds IDs to data."""
-    print("\n" + "=" * 70)
-    print("🧪 Test 3: ID Adapter")
-    print("=" * 70)
-    
-    github = GitHubClient(
-        owner=config.GITHUB_OWNER,
-        repo=config.GITHUB_REPO,
-        branch=config.GITHUB_BRANCH
-    )
-    
-    # Test with GROUPED structure (ingredientes)
-    print("\n📋 Testing with GROUPED structure (ingredientes)...")
-    adapter = IDAdapter(github, process_grouped_structure_ids)
-    ingredientes = adapter.fetch_data("ingredientes.json")
-    
-    first_item = ingredientes[0]['Opciones'][0]
-    assert 'id' in first_item, "Should have ID"
-    print(f"✅ {first_item['nombre']} → ID: {first_item['id']}")
-    
-    # Test with FLAT structure (menu)
-    print("\n📋 Testing with FLAT structure (menu)...")
-    adapter = IDAdapter(github, process_flat_structure_ids)
-    menu = adapter.fetch_data("menu.json")
-    
-    first_hotdog = menu[0]
-    assert 'id' in first_hotdog, "Should have ID"
-    print(f"✅ {first_hotdog['nombre']} → ID: {first_hotdog['id']}")
-    
-    # Test stability
-    ingredientes2 = IDAdapter(github, process_grouped_structure_ids).fetch_data("ingredientes.json")
-    assert ingredientes[0]['Opciones'][0]['id'] == ingredientes2[0]['Opciones'][0]['id']
-    print(f"✅ IDs are stable across fetches")
-    
-    print("\n✅ Test 3 PASSED: ID Adapter works correctly\n")
-
-
-def test_4_key_normalization_adapter():
-    """Test 4: Key Normalization Adapter normalizes keys."""
-    print("\n" + "=" * 70)
-    print("🧪 Test 4: Key Normalization Adapter")
-    print("=" * 70)
-    
-    github = GitHubClient(
-        owner=config.GITHUB_OWNER,
-        repo=config.GITHUB_REPO,
-        branch=config.GITHUB_BRANCH
-    )
-    
-    # Test with GROUPED structure
-    print("\n📋 Testing with GROUPED structure...")
-    adapter = KeyNormalizationAdapter(github)
-    ingredientes = adapter.fetch_data("ingredientes.json")
-    
-    first_group = ingredientes[0]
-    assert 'categoria' in first_group, "Should have 'categoria' (lowercase)"
-    assert 'opciones' in first_group, "Should have 'opciones' (lowercase)"
-    assert 'Categoria' not in first_group, "Should NOT have 'Categoria'"
-    
-    print(f"✅ Keys normalized: {list(first_group.keys())}")
-    
-    # Test with FLAT structure
-    print("\n📋 Testing with FLAT structure...")
-    menu = adapter.fetch_data("menu.json")
-    
-    first_hotdog = menu[0]
-    all_lowercase = all(key.islower() for key in first_hotdog.keys())
-    assert all_lowercase, "All keys should be lowercase"
-    
-    print(f"✅ All keys lowercase: {list(first_hotdog.keys())}")
-    
-    print("\n✅ Test 4 PASSED: Key Normalization works correctly\n")
-
-
-def test_5_stock_initialization_adapter():
-    """Test 5: Stock Initialization Adapter adds stock field."""
-    print("\n" + "=" * 70)
-    print("🧪 Test 5: Stock Initialization Adapter")
-    print("=" * 70)
-    
-    github = GitHubClient(
-        owner=config.GITHUB_OWNER,
-        repo=config.GITHUB_REPO,
-        branch=config.GITHUB_BRANCH
-    )
-    
-    # Chain: GitHub → IDs → KeyNorm → Stock
-    print("\n🔗 Building chain: GitHub → IDs → KeyNorm → Stock...")
-    adapter = StockInitializationAdapter(
-        KeyNormalizationAdapter(
-            IDAdapter(github, process_grouped_structure_ids)
-        ),
-        default_stock=50,
-        stock_by_category={
-            'pan': 100,
-            'salchicha': 75,
-            'toppings': 200,
-            'salsa': 150,
-            'acompañante': 80
-        }
-    )
-    
-    ingredientes = adapter.fetch_data("ingredientes.json")
-    
-    # Verify stock was added
-    print("\n📊 Verifying stock by category:")
-    for group in ingredientes:
-        categoria = group['categoria']
-        first_item = group['opciones'][0]
-        
-        assert 'stock' in first_item, f"Should have stock in {categoria}"
-        stock = first_item['stock']
-        
-        print(f"   {categoria.capitalize():15s} → stock: {stock}")
-        
-        # Verify correct values
-        if categoria == 'pan':
-            assert stock == 100
-        elif categoria == 'salchicha':
-            assert stock == 75
-        elif categoria == 'toppings':
-            assert stock == 200
-        elif categoria == 'salsa':
-            assert stock == 150
-        elif categoria == 'acompañante':
-            assert stock == 80
-    
-    print("\n✅ Test 5 PASSED: Stock initialization works correctly\n")
-
-
-def test_6_ingredient_reference_adapter():
-    """Test 6: Ingredient Reference Adapter converts names to {id, nombre} objects."""
-    print("\n" + "=" * 70)
-    print("🧪 Test 6: Ingredient Reference Adapter")
-    print("=" * 70)
-    
-    github = GitHubClient(
-        owner=config.GITHUB_OWNER,
-        repo=config.GITHUB_REPO,
-        branch=config.GITHUB_BRANCH
-    )
-    
-    # Setup ingredientes source (fully processed)
-    print("\n🔗 Building ingredientes chain: GitHub → IDs → KeyNorm → Stock...")
-    ingredientes_source = StockInitializationAdapter(
-        KeyNormalizationAdapter(
-            IDAdapter(github, process_grouped_structure_ids)
-        ),
-        default_stock=50
-    )
-    
-    # Setup menu with IngredientReferenceAdapter
-    print("🔗 Building menu chain: GitHub → IDs → KeyNorm → IngredientRef...")
-    menu_adapter = IngredientReferenceAdapter(
-        KeyNormalizationAdapter(
-            IDAdapter(github, process_flat_structure_ids)
-        ),
-        ingredientes_source
-    )
-    
-    menu = menu_adapter.fetch_data("menu.json")
-    
-    # Verify conversion
-    first_hotdog = menu[0]
-    print(f"\n🔍 Inspecting: {first_hotdog['nombre']}")
-    
-    # Check pan
-    pan = first_hotdog['pan']
-    assert isinstance(pan, dict), "Pan should be an object"
-    assert 'id' in pan and 'nombre' in pan, "Pan should have id and nombre"
-    print(f"   ✅ Pan: {{id: '{pan['id'][:25]}...', nombre: '{pan['nombre']}'}}")
-    
-    # Check salchicha
-    salchicha = first_hotdog['salchicha']
-    assert isinstance(salchicha, dict), "Salchicha should be an object"
-    print(f"   ✅ Salchicha: {{id: '{salchicha['id'][:25]}...', nombre: '{salchicha['nombre']}'}}")
-    
-    # Check toppings (list)
-    if first_hotdog.get('toppings') and len(first_hotdog['toppings']) > 0:
-        topping = first_hotdog['toppings'][0]
-        assert isinstance(topping, dict), "Topping should be an object"
-        print(f"   ✅ Topping: {{id: '{topping['id'][:25]}...', nombre: '{topping['nombre']}'}}")
-    
-    print("\n✅ Test 6 PASSED: Ingredient references converted correctly\n")
 
 
-def test_7_full_integration_with_persistence():
-    """Test 7: COMPLETE integration - All adapters + DataSource + Persistence."""
-    print("\n" + "=" * 70)
-    print("🧪 Test 7: FULL INTEGRATION - All Adapters + Persistence")
-    print("=" * 70)
-    
-    github = GitHubClient(
-        owner=config.GITHUB_OWNER,
-        repo=config.GITHUB_REPO,
-        branch=config.GITHUB_BRANCH
-    )
-    
-    print("\n🔗 Building COMPLETE adapter chains...")
-    print("-" * 70)
-    
-    # Ingredientes: GitHub → IDs → KeyNorm → Stock
-    ingredientes_source = StockInitializationAdapter(
-        KeyNormalizationAdapter(
-            IDAdapter(github, process_grouped_structure_ids)
-        ),
-        default_stock=50,
-        stock_by_category={
-            'pan': 100,
-            'salchicha': 75,
-            'toppings': 200,
-            'salsa': 150,
-            'acompañante': 80
-        }
-    )
-    print("✅ Ingredientes chain: GitHub → IDs → KeyNorm → Stock")
-    
-    # Menu: GitHub → IDs → KeyNorm → IngredientRef
-    menu_source = IngredientReferenceAdapter(
-        KeyNormalizationAdapter(
-            IDAdapter(github, process_flat_structure_ids)
-        ),
-        ingredientes_source
-    )
-    print("✅ Menu chain: GitHub → IDs → KeyNorm → IngredientRef")
+def test_full_integration_with_persistence(sources, tmp_path):
+    """COMPLETE integration - All adapters + DataSource + Persistence."""
+    ingredientes_source, menu_source = sources
     
     # Initialize DataSource (this will persist everything)
-    print("\n💾 Initializing DataSource with force_external=True...")
-    data_source = DataSourceClient(data_dir=config.DATA_DIR)
+    data_source = DataSourceClient(data_dir=str(tmp_path))
     data_source.initialize(
         sources={
             'ingredientes': ingredientes_source,
@@ -350,166 +74,146 @@ def test_7_full_integration_with_persistence():
         },
         force_external=True
     )
-    print("✅ DataSource initialized - ALL DATA FETCHED AND PERSISTED")
     
     # Verify ingredientes in memory
-    print("\n🔍 Verifying ingredientes in memory...")
-    print("-" * 70)
     ingredientes = data_source.get('ingredientes')
     
     first_group = ingredientes[0]
     first_item = first_group['opciones'][0]
     
     assert 'categoria' in first_group, "Should have normalized keys"
-    assert 'id' in first_item, "Should have ID"
-    assert 'stock' in first_item, "Should have stock"
-    
-    print(f"✅ Loaded {len(ingredientes)} categories")
-    print(f"   Category: {first_group['categoria']}")
-    print(f"   Item: {first_item['nombre']}")
-    print(f"   - ID: {first_item['id'][:35]}...")
-    print(f"   - Stock: {first_item['stock']}")
-    print(f"   - Keys: {list(first_group.keys())}")
+    incomplete = [
+        item['nombre']
+        for group in ingredientes for item in group['opciones']
+        if 'id' not in item or 'stock' not in item
+    ]
+    assert not incomplete, f"Items without ID or stock: {incomplete}"
     
     # Verify menu in memory
-    print("\n🔍 Verifying menu in memory...")
-    print("-" * 70)
     menu = data_source.get('menu')
     
     first_hotdog = menu[0]
     
-    assert 'id' in first_hotdog, "Should have ID"
+    missing = [hotdog['nombre'] for hotdog in menu if 'id' not in hotdog]
+    assert not missing, f"Hot dogs without ID: {missing}"
     assert isinstance(first_hotdog['pan'], dict), "Pan should be object"
     assert 'id' in first_hotdog['pan'], "Pan should have id"
     
-    print(f"✅ Loaded {len(menu)} hot dogs")
-    print(f"   Hotdog: {first_hotdog['nombre']}")
-    print(f"   - ID: {first_hotdog['id'][:35]}...")
-    print(f"   - Pan: {{id: '{first_hotdog['pan']['id'][:25]}...', nombre: '{first_hotdog['pan']['nombre']}'}}")
-    print(f"   - Keys: {list(first_hotdog.keys())}")
+    # Files must hold exactly the bytes the in-memory data serializes to
+    for name in ('ingredientes', 'menu'):
+        path = os.path.join(tmp_path, f'{name}.json')
+        with open(path, 'rb') as f:
+            file_digest = hashlib.blake2b(f.read()).hexdigest()
+        memory_digest = hashlib.blake2b(DataSourceClient.serialize(data_source.get(name))).hexdigest()
+        
+        assert file_digest == memory_digest, f"{name}.json should match in-memory data"
+    
+    # Shallow schema sanity check on the persisted menu
+    saved_pan = _read_json(os.path.join(tmp_path, 'menu.json'))[0]['pan']
+    assert isinstance(saved_pan, dict), "File should have pan as object"
+    
+    # Same client, reloaded from the files it just wrote (no external sources)
+    data_source.reload_from_disk()
     
-    # Verify persistence in files
-    print("\n💾 Verifying persistence in JSON files...")
-    print("-" * 70)
+    reloaded_ingredientes = data_source.get('ingredientes')
+    reloaded_menu = data_source.get('menu')
     
-    # Check ingredientes.json
-    with open('data/ingredientes.json', 'r', encoding='utf-8') as f:
-        saved_ingredientes = json.load(f)
+    reloaded_item = reloaded_ingredientes[0]['opciones'][0]
+    reloaded_hotdog = reloaded_menu[0]
     
-    saved_group = saved_ingredientes[0]
-    saved_item = saved_group['opciones'][0]
+    assert reloaded_ingredientes is not ingredientes, "Data should come from disk"
+    assert reloaded_item['id'] == first_item['id']
+    assert reloaded_hotdog['id'] == first_hotdog['id']
+
+
+class _FakeResponse:
+    """Minimal requests.Response stand-in (status, body, headers)."""
     
-    assert 'categoria' in saved_group, "File should have normalized keys"
-    assert 'id' in saved_item, "File should have IDs"
-    assert 'stock' in saved_item, "File should have stock"
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
     
-    print(f"✅ ingredientes.json saved correctly")
-    print(f"   - Has normalized keys: {list(saved_group.keys())}")
-    print(f"   - Has IDs: {saved_item['id'][:35]}...")
-    print(f"   - Has stock: {saved_item['stock']}")
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+
+class _ETagSession:
+    """Session stand-in that serves one payload, honors If-None-Match and records statuses."""
     
-    # Check menu.json
-    with open('data/menu.json', 'r', encoding='utf-8') as f:
-        saved_menu = json.load(f)
+    def __init__(self, content, etag):
+        self.content = content
+        self.etag = etag
+        self.statuses = []
     
-    saved_hotdog = saved_menu[0]
-    saved_pan = saved_hotdog['pan']
+    def get(self, url, timeout=None, headers=None):
+        if headers and headers.get('If-None-Match') == self.etag:
+            response = _FakeResponse(304)
+        else:
+            response = _FakeResponse(200, self.content, {'ETag': self.etag})
+        self.statuses.append(response.status_code)
+        return response
+
+
+def test_github_client_etag_revalidation(raw_menu):
+    """GitHub client revalidates with ETag and serves 304s from cache."""
+    github = GitHubClient(owner='owner', repo='repo')
+    github.session = session = _ETagSession(json_codec.dumps(raw_menu), '"menu-v1"')
     
-    assert 'id' in saved_hotdog, "File should have IDs"
-    assert isinstance(saved_pan, dict), "File should have pan as object"
-    assert 'id' in saved_pan and 'nombre' in saved_pan, "Pan should have id and nombre"
+    first = github.fetch_data("menu.json")
+    assert session.statuses[-1] == 200, "First fetch should download the body"
     
-    print(f"✅ menu.json saved correctly")
-    print(f"   - Has IDs: {saved_hotdog['id'][:35]}...")
-    print(f"   - Has ingredient refs: pan = {{id: '{saved_pan['id'][:25]}...', nombre: '{saved_pan['nombre']}'}}")
+    second = github.fetch_data("menu.json")
+    assert session.statuses[-1] == 304, "Second fetch should be a conditional 304"
+    assert second == first, "304 should return the cached data"
+    assert second is not first, "Cached data should be returned as a copy"
+
+
+def test_save_skips_unchanged_payload(tmp_path, menu_with_ids):
+    """Saving identical data leaves the file alone; changes are swapped in atomically."""
+    data_source = DataSourceClient(data_dir=str(tmp_path))
+    path = tmp_path / 'menu.json'
     
-    # Verify reload from files
-    print("\n🔄 Verifying reload from local files...")
-    print("-" * 70)
+    data_source.save('menu', menu_with_ids)
+    first_mtime = path.stat().st_mtime_ns
+    os.utime(path, ns=(first_mtime - 10**9, first_mtime - 10**9))
     
-    data_source_2 = DataSourceClient(data_dir=config.DATA_DIR)
-    data_source_2.initialize(
-        sources={
-            'ingredientes': ingredientes_source,
-            'menu': menu_source
-        },
-        force_external=False  # Load from local files
-    )
+    data_source.save('menu', menu_with_ids)
+    assert path.stat().st_mtime_ns == first_mtime - 10**9, "Unchanged data should not be rewritten"
     
-    reloaded_ingredientes = data_source_2.get('ingredientes')
-    reloaded_menu = data_source_2.get('menu')
-    
-    assert reloaded_ingredientes[0]['opciones'][0]['id'] == first_item['id']
-    assert reloaded_menu[0]['id'] == first_hotdog['id']
-    
-    print(f"✅ Reloaded from local files successfully")
-    print(f"   - Ingredientes ID matches: {reloaded_ingredientes[0]['opciones'][0]['id'][:35]}...")
-    print(f"   - Menu ID matches: {reloaded_menu[0]['id'][:35]}...")
-    
-    print("\n" + "=" * 70)
-    print("🎉 TEST 7 PASSED - FULL INTEGRATION SUCCESSFUL!")
-    print("=" * 70)
-    print("\n📊 Summary of what was tested:")
-    print("   ✅ All adapters work together in chains")
-    print("   ✅ IDs are stable and deterministic")
-    print("   ✅ Keys are normalized (lowercase, no accents)")
-    print("   ✅ Stock is initialized by category")
-    print("   ✅ Ingredient references are {id, nombre} objects")
-    print("   ✅ Everything persists correctly to JSON files")
-    print("   ✅ Data reloads correctly from local files")
-    print("=" * 70 + "\n")
+    data_source.save('menu', menu_with_ids[:1])
+    assert _read_json(path) == menu_with_ids[:1], "Changed data should be written"
+    assert not list(tmp_path.glob('*.tmp')), "Temporary file should be swapped in"
 
 
-def run_all_tests():
-    """Run all tests in sequence."""
-    print("\n" + "=" * 70)
-    print("🚀 DATASOURCE & ADAPTER TEST SUITE")
-    print(f"📁 GitHub: {config.GITHUB_OWNER}/{config.GITHUB_REPO}")
-    print(f"📂 Data directory: {config.DATA_DIR}")
-    print("=" * 70)
-    
-    tests = [
-        test_1_github_client_raw,
-        test_2_stable_ids,
-        test_3_id_adapter,
-        test_4_key_normalization_adapter,
-        test_5_stock_initialization_adapter,
-        test_6_ingredient_reference_adapter,
-        test_7_full_integration_with_persistence,
-    ]
+def test_github_client_disk_etag_cache(tmp_path, raw_menu):
+    """ETags persisted in cache_dir let a new client revalidate with a 304."""
+    session = _ETagSession(json_codec.dumps(raw_menu), '"menu-v1"')
+    
+    first_client = GitHubClient(owner='owner', repo='repo', cache_dir=str(tmp_path))
+    first_client.session = session
+    first = first_client.fetch_data("menu.json")
+    assert session.statuses[-1] == 200, "Cold cache should download the body"
+    
+    second_client = GitHubClient(owner='owner', repo='repo', cache_dir=str(tmp_path))
+    second_client.session = session
+    second = second_client.fetch_data("menu.json")
+    assert session.statuses[-1] == 304, "Warm disk cache should revalidate with a 304"
+    assert second == first, "304 should return the persisted body"
     
-    passed = 0
-    failed = 0
-    
-    for test_func in tests:
-        try:
-            test_func()
-            passed += 1
-        except AssertionError as e:
-            print(f"\n❌ TEST FAILED: {test_func.__name__}")
-            print(f"   Error: {e}")
-            failed += 1
-        except Exception as e:
-            print(f"\n💥 TEST ERROR: {test_func.__name__}")
-            print(f"   Exception: {e}")
-            import traceback
-            traceback.print_exc()
-            failed += 1
-    
-    print("\n" + "=" * 70)
-    print("📊 FINAL RESULTS")
-    print("=" * 70)
-    print(f"✅ Passed: {passed}/{len(tests)}")
-    print(f"❌ Failed: {failed}/{len(tests)}")
-    
-    if failed == 0:
-        print("\n🎉 ALL TESTS PASSED! System is ready for use.")
-    
-    print("=" * 70 + "\n")
-    
-    return failed == 0
+    other_branch = GitHubClient(owner='owner', repo='repo', branch='dev', cache_dir=str(tmp_path))
+    other_branch.session = session
+    other_branch.fetch_data("menu.json")
+    assert session.statuses[-1] == 200, "Cache entries should be per owner/repo/branch"
 
 
-if __name__ == "__main__":
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
+@pytest.mark.network
+@pytest.mark.parametrize("filename", ["ingredientes.json", "menu.json"])
+def test_recorded_payloads_match_github(live_github_client, filename):
+    """The recorded fixtures still match the live GitHub files."""
+    recorded_path = os.path.join(os.path.dirname(__file__), 'fixtures', 'github', filename)
+    
+    assert live_github_client.fetch_data(filename) == _read_json(recorded_path), (
+        f"{filename} changed on GitHub: refresh it with HDM_GITHUB_MODE=record pytest"
+    )
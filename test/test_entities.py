@@ -1,5 +1,5 @@
 """
-Test script for entity creation system.
+Tests for the entity creation system.
 
 Tests the dynamic entity generation, schema inference, plugin injection,
 and validation composition for ingredients and hotdogs.
@@ -8,362 +8,255 @@ Author: Rafael Correa
 Date: November 13, 2025
 """
 
-import sys
-from pathlib import Path
+import logging
 
-# Add parent directory to path to import modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-from models import create_ingredient_entities, create_hotdog_entities
+from models import create_ingredient_entities, create_hotdog_entities, clear_entity_caches
+from models.core.base_entity import Entity
 
 
-def test_ingredient_entities_with_fallback():
+log = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope="session")
+def entity_classes():
+    """Ingredient entity classes built from the fallback schemas."""
+    return create_ingredient_entities()
+
+
+@pytest.fixture(scope="session")
+def hotdog_cls():
+    """HotDog entity class built from the fallback schema."""
+    return create_hotdog_entities()['HotDog']
+
+
+@pytest.fixture
+def pan_cls(entity_classes):
+    """Pan entity class."""
+    return entity_classes['Pan']
+
+
+@pytest.fixture
+def salchicha_cls(entity_classes):
+    """Salchicha entity class."""
+    return entity_classes['Salchicha']
+
+
+def _pan(pan_cls, **overrides):
+    """Build a valid Pan (normalized keys: tamaño -> tamano), with overrides."""
+    fields = {
+        'id': 'pan-001',
+        'entity_type': 'Pan',
+        'nombre': 'baguette',
+        'stock': 10,
+        'tipo': 'francés',
+        'tamano': 10,
+        'unidad': 'pulgadas'
+    }
+    fields.update(overrides)
+    return pan_cls(**fields)
+
+
+def _hotdog(hotdog_cls, **overrides):
+    """Build a valid HotDog without toppings, salsas or acompañante, with overrides."""
+    fields = {
+        'id': 'hotdog-001',
+        'entity_type': 'HotDog',
+        'nombre': 'simple',
+        'pan': 'simple',
+        'salchicha': 'weiner',
+        'toppings': [],
+        'salsas': [],
+        'acompanante': None
+    }
+    fields.update(overrides)
+    return hotdog_cls(**fields)
+
+
+def test_ingredient_entities_with_fallback(entity_classes):
     """Test ingredient entity creation with fallback schemas."""
-    print("\n" + "="*60)
-    print("TEST 1: Creating ingredient entities with fallback schemas")
-    print("="*60)
+    log.debug("Available entity types: %s", list(entity_classes))
     
-    # Create entities without raw data (uses fallback)
-    # NOW RETURNS A DICT!
-    entities = create_ingredient_entities()
+    # Category names are normalized into class names (no ñ, capitalized)
+    for name in ('Ingredient', 'Pan', 'Salchicha', 'Toppings', 'Salsa', 'Acompanante'):
+        assert name in entity_classes, f"Missing entity class '{name}'"
     
-    # DEBUG: Ver qué claves están disponibles
-    print("\n🔍 DEBUG - Available entity types:")
-    for entity_type in entities.keys():
-        print(f"  - '{entity_type}'")
-    
-    # Extract classes from dict
-    Ingredient = entities['Ingredient']
-    Pan = entities['Pan']
-    Salchicha = entities['Salchicha']
-    Toppings = entities['Toppings']  # Note: Capitalized!
-    Salsa = entities['Salsa']
-    
-    # DEBUG: Intentar diferentes variaciones para Acompañante
-    print("\n🔍 DEBUG - Trying to find Acompañante:")
-    possible_keys = ['Acompanante', 'Acompañante', 'acompanante', 'acompañante']
-    acompanante_key = None
-    for key in possible_keys:
-        if key in entities:
-            print(f"  ✅ Found as '{key}'")
-            acompanante_key = key
-            break
-        else:
-            print(f"  ❌ Not found as '{key}'")
-    
-    if acompanante_key is None:
-        raise KeyError(f"Could not find Acompañante variant. Available keys: {list(entities.keys())}")
-    
-    Acompanante = entities[acompanante_key]
-    
-    print("\n✅ Successfully created classes:")
-    print(f"  - Ingredient: {Ingredient}")
-    print(f"  - Pan: {Pan}")
-    print(f"  - Salchicha: {Salchicha}")
-    print(f"  - Toppings: {Toppings}")
-    print(f"  - Salsa: {Salsa}")
-    print(f"  - Acompanante (key='{acompanante_key}'): {Acompanante}")
-    
-    # Test inheritance
-    print("\n📋 Testing inheritance:")
-    print(f"  - Pan inherits from Ingredient: {issubclass(Pan, Ingredient)}")
-    print(f"  - Salchicha inherits from Ingredient: {issubclass(Salchicha, Ingredient)}")
-    
-    return Ingredient, Pan, Salchicha, Toppings, Salsa, Acompanante
+    Ingredient = entity_classes['Ingredient']
+    for name in ('Pan', 'Salchicha', 'Toppings', 'Salsa', 'Acompanante'):
+        assert issubclass(entity_classes[name], Ingredient), f"{name} should inherit from Ingredient"
 
 
-def test_pan_instantiation(Pan):
-    """Test Pan entity instantiation."""
-    print("\n" + "="*60)
-    print("TEST 2: Pan instantiation")
-    print("="*60)
-    
-    # Create a Pan instance
-    # Note: Schema keys are normalized (no accents)
-    pan = Pan(
-        id='pan-001',
-        entity_type='Pan',
-        nombre='baguette',
-        tipo='francés',
-        tamano=10,  # normalized: tamaño -> tamano
-        unidad='pulgadas'
-    )
-    
-    print(f"✅ Created Pan instance: {pan}")
-    
-    # Test attribute access
-    print(f"\n📋 Attributes:")
-    print(f"  - nombre: {pan.nombre}")
-    print(f"  - tipo: {pan.tipo}")
-    print(f"  - tamano: {pan.tamano}")  # normalized
-    print(f"  - unidad: {pan.unidad}")
-    
-    # Test to_dict
-    print(f"\n📦 to_dict(): {pan.to_dict()}")
-    
-    return pan
+def test_pan_instantiation(pan_cls):
+    """Test Pan entity instantiation, attribute access and to_dict()."""
+    pan = _pan(pan_cls)
+    log.debug("Created Pan instance: %s", pan)
+    
+    assert pan.nombre == 'baguette'
+    assert pan.tipo == 'francés'
+    assert pan.tamano == 10
+    assert pan.unidad == 'pulgadas'
+    
+    data = pan.to_dict()
+    assert data['id'] == 'pan-001'
+    assert data['entity_type'] == 'Pan'
+    assert data['tamano'] == 10
 
 
-def test_pan_validation(Pan):
+def test_pan_validation(pan_cls):
     """Test Pan validation (base + specific)."""
-    print("\n" + "="*60)
-    print("TEST 3: Pan validation")
-    print("="*60)
+    assert _pan(pan_cls, nombre='integral', tipo='trigo', tamano=8).validate()
     
-    # Valid pan
-    print("📋 Testing valid Pan:")
-    valid_pan = Pan(
-        id='pan-002',
-        entity_type='Pan',
-        nombre='integral',
-        tipo='trigo',
-        tamano=8,  # normalized
-        unidad='pulgadas'
-    )
-    
-    try:
-        valid_pan.validate()
-        print("  ✅ Validation passed")
-    except ValueError as e:
-        print(f"  ❌ Validation failed: {e}")
-    
-    # Invalid pan - missing nombre (base validation should catch)
-    print("\n📋 Testing Pan without nombre (should fail base validation):")
-    try:
-        invalid_pan = Pan(
-            id='pan-003',
-            entity_type='Pan',
-            nombre='',  # Empty nombre
-            tipo='blanco',
-            tamano=6,  # normalized
-            unidad='pulgadas'
-        )
-        invalid_pan.validate()
-        print("  ❌ Validation should have failed!")
-    except ValueError as e:
-        print(f"  ✅ Validation failed as expected: {e}")
+    # Empty nombre: caught by the base Ingredient validator
+    with pytest.raises(ValueError):
+        _pan(pan_cls, nombre='').validate()
     
-    # Invalid pan - negative tamano (specific validation should catch)
-    print("\n📋 Testing Pan with negative tamano (should fail specific validation):")
-    try:
-        invalid_pan2 = Pan(
-            id='pan-004',
-            entity_type='Pan',
-            nombre='test',
-            tipo='blanco',
-            tamano=-5,  # Negative, normalized
-            unidad='pulgadas'
-        )
-        invalid_pan2.validate()
-        print("  ❌ Validation should have failed!")
-    except ValueError as e:
-        print(f"  ✅ Validation failed as expected: {e}")
-
-
-def test_salchicha_matches_size(Salchicha, Pan):
+    # Negative tamano: caught by the Pan-specific validator
+    with pytest.raises(ValueError):
+        _pan(pan_cls, nombre='test', tamano=-5).validate()
+
+
+def test_salchicha_matches_size(salchicha_cls, pan_cls):
     """Test Salchicha matches_size method with Pan."""
-    print("\n" + "="*60)
-    print("TEST 4: Salchicha matches_size with Pan")
-    print("="*60)
-    
-    # Create salchicha and pan with matching sizes
-    salchicha = Salchicha(
+    salchicha = salchicha_cls(
         id='salchicha-001',
         entity_type='Salchicha',
         nombre='chorizo',
+        stock=10,
         tipo='español',
-        tamano=10,  # normalized
+        tamano=10,
         unidad='pulgadas'
     )
+    pan_matching = _pan(pan_cls, id='pan-005', nombre='largo', tamano=10)
+    pan_different = _pan(pan_cls, id='pan-006', nombre='corto', tamano=6)
     
-    pan_matching = Pan(
-        id='pan-005',
-        entity_type='Pan',
-        nombre='largo',
-        tipo='blanco',
-        tamano=10,  # normalized
-        unidad='pulgadas'
-    )
-    
-    pan_different = Pan(
-        id='pan-006',
-        entity_type='Pan',
-        nombre='corto',
-        tipo='blanco',
-        tamano=6,  # normalized
-        unidad='pulgadas'
-    )
-    
-    print(f"✅ Created Salchicha (tamano=10): {salchicha.nombre}")
-    print(f"✅ Created Pan matching (tamano=10): {pan_matching.nombre}")
-    print(f"✅ Created Pan different (tamano=6): {pan_different.nombre}")
-    
-    # Test matches_size
-    print(f"\n🔧 Testing matches_size method:")
-    print(f"  - salchicha.matches_size(pan_matching): {salchicha.matches_size(pan_matching)}")  # Should be True
-    print(f"  - salchicha.matches_size(pan_different): {salchicha.matches_size(pan_different)}")  # Should be False
+    assert salchicha.matches_size(pan_matching)
+    assert not salchicha.matches_size(pan_different)
+    assert not salchicha.matches_size(object()), "Entities without tamano never match"
+    assert salchicha.validate()
     
-    # Test validation
-    print(f"\n📋 Testing validation:")
-    try:
-        salchicha.validate()
-        print("  ✅ Salchicha validation passed")
-    except ValueError as e:
-        print(f"  ❌ Validation failed: {e}")
+    # Two unset (None) tamanos are equal, as with the original hasattr() check
+    salchicha.tamano = None
+    assert salchicha.matches_size(_pan(pan_cls, tamano=None))
 
 
-def test_simple_ingredients(Toppings, Salsa, Acompanante):
+def test_simple_ingredients(entity_classes):
     """Test simpler ingredient types (Toppings, Salsa, Acompanante)."""
-    print("\n" + "="*60)
-    print("TEST 5: Simple ingredients (Toppings, Salsa, Acompanante)")
-    print("="*60)
-    
-    # Toppings (capitalized and plural!)
-    # Note: Toppings has 'tipo' and 'presentacion' properties
-    topping = Toppings(
+    # Toppings (capitalized and plural!) with 'tipo' and 'presentacion'
+    topping = entity_classes['Toppings'](
         id='topping-001',
         entity_type='Toppings',
         nombre='cebolla',
+        stock=10,
         tipo='vegetales',
-        presentacion='picada'  # Required property!
+        presentacion='picada'
     )
-    print(f"✅ Created Toppings: {topping}")
-    topping.validate()
-    print("  ✅ Toppings validation passed")
     
-    # Salsa
-    # Note: Salsa has 'base' and 'color' properties (from fallback)
-    salsa = Salsa(
+    # Salsa has 'base' and 'color' properties (from fallback)
+    salsa = entity_classes['Salsa'](
         id='salsa-001',
         entity_type='Salsa',
         nombre='ketchup',
+        stock=10,
         base='tomate',
         color='rojo'
     )
-    print(f"\n✅ Created Salsa: {salsa}")
-    salsa.validate()
-    print("  ✅ Salsa validation passed")
     
-    # Acompanante (normalized: no ñ in class name)
-    # Note: Acompanante has 'tipo', 'tamano', 'unidad' properties (from fallback)
-    acompanante = Acompanante(
+    # Acompanante (normalized: no ñ in class name) has 'tipo', 'tamano', 'unidad'
+    acompanante = entity_classes['Acompanante'](
         id='acomp-001',
-        entity_type='Acompanante',  # Note: normalized, no ñ
+        entity_type='Acompanante',
         nombre='Papas',
+        stock=10,
         tipo='fritas',
-        tamano=100,  # normalized
+        tamano=100,
         unidad='gramos'
     )
-    print(f"\n✅ Created Acompanante: {acompanante}")
-    acompanante.validate()
-    print("  ✅ Acompanante validation passed")
+    
+    for ingredient in (topping, salsa, acompanante):
+        log.debug("Created %s: %s", type(ingredient).__name__, ingredient)
+        assert ingredient.validate()
 
 
-def test_hotdog_entities():
+def test_hotdog_entities(hotdog_cls):
     """Test HotDog entity creation and functionality."""
-    print("\n" + "="*60)
-    print("TEST 6: HotDog entity")
-    print("="*60)
+    hotdog = _hotdog(hotdog_cls)
     
-    # Create HotDog class with fallback
-    # NOW RETURNS A DICT!
-    entities = create_hotdog_entities()
-    HotDog = entities['HotDog']
-    print(f"✅ Created HotDog class: {HotDog}")
-    
-    # Create instance
-    # Note: Keys are normalized (no accents, lowercase)
-    hotdog = HotDog(
-        id='hotdog-001',
-        entity_type='HotDog',
-        nombre='simple',
-        pan='simple',  # normalized: Pan -> pan
-        salchicha='weiner',  # normalized: Salchicha -> salchicha
-        toppings=[],
-        salsas=[],
-        acompanante=None  # normalized: Acompañante -> acompanante
-    )
+    assert not hotdog.has_toppings()
+    assert not hotdog.has_salsas()
+    assert not hotdog.is_combo()
+    assert hotdog.validate()
     
-    print(f"\n✅ Created HotDog instance: {hotdog}")
-    
-    # Test methods
-    print(f"\n🔧 Testing methods:")
-    print(f"  - has_toppings(): {hotdog.has_toppings()}")  # Should be False
-    print(f"  - has_salsas(): {hotdog.has_salsas()}")  # Should be False
-    print(f"  - is_combo(): {hotdog.is_combo()}")  # Should be False
-    
-    # Test with toppings and combo
-    hotdog_combo = HotDog(
+    hotdog_combo = _hotdog(
+        hotdog_cls,
         id='hotdog-002',
-        entity_type='HotDog',
         nombre='especial',
-        pan='integral',  # normalized
-        salchicha='chorizo',  # normalized
+        pan='integral',
+        salchicha='chorizo',
         toppings=['cebolla', 'tomate'],
         salsas=['ketchup', 'mostaza'],
-        acompanante='Papas'  # normalized
+        acompanante='Papas'
     )
     
-    print(f"\n✅ Created HotDog combo: {hotdog_combo}")
-    print(f"  - has_toppings(): {hotdog_combo.has_toppings()}")  # Should be True
-    print(f"  - has_salsas(): {hotdog_combo.has_salsas()}")  # Should be True
-    print(f"  - is_combo(): {hotdog_combo.is_combo()}")  # Should be True
+    assert hotdog_combo.has_toppings()
+    assert hotdog_combo.has_salsas()
+    assert hotdog_combo.is_combo()
+    
+    # Empty nombre must fail validation
+    with pytest.raises(ValueError):
+        _hotdog(hotdog_cls, id='hotdog-003', nombre='').validate()
+
+
+def test_fallback_entities_are_cached():
+    """Test fallback entity classes are built once until the cache is cleared."""
+    first = create_ingredient_entities()
+    second = create_ingredient_entities()
+    
+    assert first is not second, "Each call should get its own dict"
+    assert first['Pan'] is second['Pan'], "Fallback classes should be reused"
+    assert create_hotdog_entities()['HotDog'] is create_hotdog_entities()['HotDog']
+    
+    # Mutating a returned dict must not leak into the cache
+    first.pop('Pan')
+    assert 'Pan' in create_ingredient_entities()
+    
+    clear_entity_caches()
+    assert create_ingredient_entities()['Pan'] is not second['Pan'], \
+        "clear_entity_caches() should force regeneration"
+
+
+def test_generated_entities_are_slotted(entity_classes):
+    """Test generated entity fields live in __slots__ and to_dict() keeps field order."""
+    Ingredient, Pan = entity_classes['Ingredient'], entity_classes['Pan']
+    
+    assert 'nombre' in Ingredient.__slots__
+    assert 'nombre' not in Pan.__slots__, "Inherited fields should not be re-slotted"
+    
+    fields = {
+        'id': 'pan-007', 'entity_type': 'Pan', 'nombre': 'brioche', 'stock': 3,
+        'tipo': 'dulce', 'tamano': 6, 'unidad': 'pulgadas'
+    }
+    pan = Pan(**fields)
+    
+    assert not hasattr(pan, '__dict__'), "Generated entities should not carry a __dict__"
+    with pytest.raises(AttributeError):
+        pan.extra = 5
+    
+    assert pan.to_dict() == fields
+    assert list(pan.to_dict()) == list(fields), "to_dict() should follow field order"
+    log.debug("%s slots: %s", Pan.__name__, Pan.__slots__)
+
+
+def test_entity_can_be_built_directly():
+    """Test Entity works on its own with **kwargs and from_dict, keeping a __dict__."""
+    entity = Entity(id='x', entity_type='T', nombre='a')
     
-    # Test validation
-    print(f"\n📋 Testing validation:")
-    try:
-        hotdog.validate()
-        print("  ✅ HotDog validation passed")
-    except ValueError as e:
-        print(f"  ❌ Validation failed: {e}")
+    assert entity.nombre == 'a'
+    assert entity.to_dict() == {'id': 'x', 'entity_type': 'T', 'nombre': 'a'}
     
-    # Test invalid hotdog
-    print(f"\n📋 Testing invalid HotDog (empty nombre):")
-    try:
-        invalid_hotdog = HotDog(
-            id='hotdog-003',
-            entity_type='HotDog',
-            nombre='',
-            pan='simple',  # normalized
-            salchicha='weiner',  # normalized
-            toppings=[],
-            salsas=[],
-            acompanante=None  # normalized
-        )
-        invalid_hotdog.validate()
-        print("  ❌ Validation should have failed!")
-    except ValueError as e:
-        print(f"  ✅ Validation failed as expected: {e}")
-
-
-def run_all_tests():
-    """Run all entity tests."""
-    print("\n" + "🎯" * 30)
-    print("TESTING ENTITY CREATION SYSTEM")
-    print("🎯" * 30)
+    entity.extra = 5
+    assert entity.to_dict()['extra'] == 5, "Entity keeps a __dict__ for dynamic attributes"
     
-    try:
-        # Test ingredients
-        Ingredient, Pan, Salchicha, Toppings, Salsa, Acompanante = test_ingredient_entities_with_fallback()
-        test_pan_instantiation(Pan)
-        test_pan_validation(Pan)
-        test_salchicha_matches_size(Salchicha, Pan)
-        test_simple_ingredients(Toppings, Salsa, Acompanante)
-        
-        # Test hotdogs
-        test_hotdog_entities()
-        
-        print("\n" + "="*60)
-        print("✅ ALL TESTS PASSED!")
-        print("="*60)
-        
-    except Exception as e:
-        print("\n" + "="*60)
-        print(f"❌ TEST FAILED: {e}")
-        print("="*60)
-        import traceback
-        traceback.print_exc()
-
-
-if __name__ == '__main__':
-    run_all_tests()
+    copy = Entity.from_dict(entity.to_dict())
+    assert copy == entity
+    assert copy.to_dict() == entity.to_dict()
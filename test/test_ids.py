@@ -0,0 +1,98 @@
+"""
+Tests for stable ID generation and the ID Adapter.
+
+Covers generate_stable_id and the GROUPED and FLAT
+ID processors, both directly and wrapped in an IDAdapter.
+
+Author: Rafael Correa
+Date: November 17, 2025
+"""
+
+import hashlib
+import uuid
+
+import pytest
+
+from clients.external_sources.frozen_source import FrozenSource
+from clients.adapters import IDAdapter
+from clients.id_processors import (
+    generate_stable_id,
+    process_grouped_structure_ids,
+    process_flat_structure_ids
+)
+
+
+def _first_item(data):
+    """First item of a GROUPED (first option of first group) or FLAT structure."""
+    first = data[0]
+    return first['Opciones'][0] if 'Opciones' in first else first
+
+
+def _id_fingerprint(data):
+    """Digest of every item ID, in order (one hash instead of comparing lists)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for item in _all_items(data):
+        digest.update(item['id'].encode('utf-8'))
+        digest.update(b'\0')
+    return digest.digest()
+
+
+def _all_items(data):
+    """All items of a GROUPED (every option of every group) or FLAT structure."""
+    if data and 'Opciones' in data[0]:
+        return [item for group in data for item in group['Opciones']]
+    return list(data)
+
+
+def test_2_stable_ids():
+    """Test 2: Stable ID generation is deterministic."""
+    # Same input = same ID (second call is served from the memo cache)
+    id1 = generate_stable_id("simple", "Pan")
+    hits_before = generate_stable_id.cache_info().hits
+    id2 = generate_stable_id("simple", "Pan")
+    assert id1 == id2, "Same input should produce same ID"
+    assert generate_stable_id.cache_info().hits > hits_before, "Repeated call should hit the cache"
+    
+    # Different input = different ID
+    id_pan = generate_stable_id("simple", "Pan")
+    id_salsa = generate_stable_id("simple", "Salsa")
+    assert id_pan != id_salsa, "Different category should produce different ID"
+    
+    # Valid UUID format (canonical lowercase hex 8-4-4-4-12)
+    assert str(uuid.UUID(id1)) == id1, "Should be valid UUID format"
+
+
+@pytest.mark.parametrize(
+    "raw_fixture, with_ids_fixture, processor",
+    [
+        ("raw_ingredientes", "ingredientes_with_ids", process_grouped_structure_ids),
+        ("raw_menu", "menu_with_ids", process_flat_structure_ids),
+    ],
+    ids=["grouped", "flat"]
+)
+def test_3_id_adapter(request, raw_fixture, with_ids_fixture, processor):
+    """Test 3: ID Adapter adds IDs to data."""
+    # The raw payload crosses the wire once per session and the session fixture
+    # already processed it once; ID stability is checked against that result
+    raw = request.getfixturevalue(raw_fixture)
+    expected = _id_fingerprint(request.getfixturevalue(with_ids_fixture))
+    
+    # Processors copy on write, so the shared session payload can be passed as-is
+    hits_before = generate_stable_id.cache_info().hits
+    data, modified = processor(raw)
+    assert modified, "Raw data should be modified"
+    assert 'id' not in _first_item(raw), "Processor should not mutate its input"
+    missing = [item['nombre'] for item in _all_items(data) if 'id' not in item]
+    assert not missing, f"Items without ID: {missing}"
+    
+    # Re-processing data that already has IDs is a no-op returning the same object
+    assert processor(data) == (data, False), "Processed data should be left as-is"
+    
+    # Test stability (re-processing reuses memoized IDs)
+    assert _id_fingerprint(data) == expected, "IDs should be stable"
+    assert generate_stable_id.cache_info().hits > hits_before, "Re-processing should hit the ID cache"
+    
+    # Adapter integrates the processor (frozen source: no extra fetch)
+    adapter = IDAdapter(FrozenSource({raw_fixture: raw}), processor)
+    adapted = adapter.fetch_data(raw_fixture)
+    assert _id_fingerprint(adapted) == expected, "Adapter should apply the processor"
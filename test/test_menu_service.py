@@ -8,114 +8,62 @@ Author: Rafael Correa
 Date: November 16, 2025
 """
 
-import sys
-import os
-
-# Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from clients.external_sources.github_client import GitHubClient
-from clients.adapters import (
-    IDAdapter,
-    KeyNormalizationAdapter,
-    StockInitializationAdapter,
-    IngredientReferenceAdapter
-)
-from clients.id_processors import process_grouped_structure_ids, process_flat_structure_ids
+import logging
+
+import pytest
+
 from clients.data_source_client import DataSourceClient
 from handlers.data_handler import DataHandler
 from services import MenuService, IngredientService
-import config
 
+log = logging.getLogger(__name__)
 
-def setup_test_handler():
-    """Setup DataHandler with full adapter chain for testing."""
-    github = GitHubClient(
-        owner=config.GITHUB_OWNER,
-        repo=config.GITHUB_REPO,
-        branch=config.GITHUB_BRANCH
-    )
+
+@pytest.fixture
+def handler(fresh_data_dir):
+    """
+    Fresh DataHandler for each test, over its own copy of the baseline data.
     
-    # Ingredientes chain
-    ingredientes_source = StockInitializationAdapter(
-        KeyNormalizationAdapter(
-            IDAdapter(github, process_grouped_structure_ids)
-        ),
-        default_stock=50,
-        stock_by_category={
-            'pan': 100,
-            'salchicha': 75,
-            'toppings': 200,
-            'salsa': 150,
-            'acompañante': 80
-        }
-    )
+    The baseline is the conftest `processed_payloads` (recorded GitHub
+    payloads by default, see HDM_GITHUB_MODE), so no network is needed.
     
-    # Menu chain
-    menu_source = IngredientReferenceAdapter(
-        KeyNormalizationAdapter(
-            IDAdapter(github, process_flat_structure_ids)
-        ),
-        ingredientes_source
-    )
+    Returns:
+        DataHandler instance
+    """
+    data_source = DataSourceClient(data_dir=str(fresh_data_dir))
     
-    # Initialize DataSource
-    data_source = DataSourceClient(data_dir=config.DATA_DIR)
-    data_source.initialize({
-        'ingredientes': ingredientes_source,
-        'menu': menu_source
-    }, force_external=False)  # Use local cache for faster tests
+    # No external sources: everything is loaded from the copied files
+    data_source.initialize({'ingredientes': None, 'menu': None, 'ventas': None})
     
     return DataHandler(data_source)
 
 
-def teardown_test_handler(handler):
-    """Teardown: commit changes to persist test state."""
-    if handler.has_changes:
-        handler.commit()
-
-
 # ────────────────────────────────────────────────────────────
 # TESTS - LISTAR HOT DOGS
 # ────────────────────────────────────────────────────────────
 
-def test_1_list_all_hotdogs():
+def test_1_list_all_hotdogs(handler):
     """Test 1: List all hot dogs in menu."""
-    print("\n" + "="*70)
-    print("🧪 Test 1: List all hot dogs")
-    print("="*70)
-    
-    handler = setup_test_handler()
-    
     hotdogs = MenuService.list_all(handler)
     
     assert isinstance(hotdogs, list), "Should return a list"
     assert len(hotdogs) > 0, "Should have at least one hot dog"
     
-    print(f"\n✅ Found {len(hotdogs)} hot dogs in menu")
+    log.debug("✅ Found %s hot dogs in menu", len(hotdogs))
     
     # Show first few
     for i, hd in enumerate(hotdogs[:3]):
-        print(f"   {i+1}. {hd.nombre}")
-        print(f"      Pan: {hd.pan['nombre']}")
-        print(f"      Salchicha: {hd.salchicha['nombre']}")
-    
-    teardown_test_handler(handler)
-    print("\n✅ Test 1 PASSED\n")
+        log.debug("   %s. %s", i + 1, hd.nombre)
+        log.debug("      Pan: %s", hd.pan['nombre'])
+        log.debug("      Salchicha: %s", hd.salchicha['nombre'])
 
 
-def test_2_get_by_name():
+def test_2_get_by_name(handler):
     """Test 2: Get specific hot dog by name."""
-    print("\n" + "="*70)
-    print("🧪 Test 2: Get hot dog by name")
-    print("="*70)
-    
-    handler = setup_test_handler()
-    
     # Get first hotdog name
     all_hotdogs = MenuService.list_all(handler)
     if not all_hotdogs:
-        print("⚠️  No hay hot dogs para probar")
+        log.debug("⚠️  No hay hot dogs para probar")
         return
     
     test_name = all_hotdogs[0].nombre
@@ -125,61 +73,43 @@ def test_2_get_by_name():
     assert hotdog is not None, f"Should find hotdog '{test_name}'"
     assert hotdog.nombre == test_name, "Name should match"
     
-    print(f"\n✅ Found hot dog: {hotdog.nombre}")
-    print(f"   Pan: {hotdog.pan['nombre']}")
-    print(f"   Salchicha: {hotdog.salchicha['nombre']}")
-    print(f"   Toppings: {[t['nombre'] for t in hotdog.toppings]}")
-    print(f"   Salsas: {[s['nombre'] for s in hotdog.salsas]}")
+    log.debug("✅ Found hot dog: %s", hotdog.nombre)
+    log.debug("   Pan: %s", hotdog.pan['nombre'])
+    log.debug("   Salchicha: %s", hotdog.salchicha['nombre'])
+    log.debug("   Toppings: %s", [t['nombre'] for t in hotdog.toppings])
+    log.debug("   Salsas: %s", [s['nombre'] for s in hotdog.salsas])
     
     # Test non-existent
     non_existent = MenuService.get_by_name(handler, 'no_existe_este_hotdog')
     assert non_existent is None, "Should return None for non-existent"
     
-    print(f"✅ Non-existent hot dog returns None correctly")
-    
-    teardown_test_handler(handler)
-    print("\n✅ Test 2 PASSED\n")
+    log.debug("✅ Non-existent hot dog returns None correctly")
 
 
-def test_3_get_combos_and_simple():
+def test_3_get_combos_and_simple(handler):
     """Test 3: Get combos and simple hot dogs."""
-    print("\n" + "="*70)
-    print("🧪 Test 3: Get combos and simple hot dogs")
-    print("="*70)
-    
-    handler = setup_test_handler()
-    
     combos = MenuService.get_combos(handler)
     simples = MenuService.get_simple_hotdogs(handler)
     
-    print(f"\n✅ Found {len(combos)} combos")
+    log.debug("✅ Found %s combos", len(combos))
     for combo in combos[:3]:
-        print(f"   - {combo.nombre} (con {combo.acompanante['nombre']})")
+        log.debug("   - %s (con %s)", combo.nombre, combo.acompanante['nombre'])
     
-    print(f"\n✅ Found {len(simples)} simple hot dogs")
+    log.debug("✅ Found %s simple hot dogs", len(simples))
     for simple in simples[:3]:
-        print(f"   - {simple.nombre}")
-    
-    teardown_test_handler(handler)
-    print("\n✅ Test 3 PASSED\n")
+        log.debug("   - %s", simple.nombre)
 
 
 # ────────────────────────────────────────────────────────────
 # TESTS - VERIFICAR DISPONIBILIDAD
 # ────────────────────────────────────────────────────────────
 
-def test_4_check_availability():
+def test_4_check_availability(handler):
     """Test 4: Check inventory availability for a hot dog."""
-    print("\n" + "="*70)
-    print("🧪 Test 4: Check availability")
-    print("="*70)
-    
-    handler = setup_test_handler()
-    
     # Get a hotdog to check
     all_hotdogs = MenuService.list_all(handler)
     if not all_hotdogs:
-        print("⚠️  No hay hot dogs para probar")
+        log.debug("⚠️  No hay hot dogs para probar")
         return
     
     hotdog = all_hotdogs[0]
@@ -188,33 +118,26 @@ def test_4_check_availability():
     
     assert 'disponible' in result, "Should return disponible status"
     
-    print(f"\n🔍 Checking availability for: {hotdog.nombre}")
+    log.debug("🔍 Checking availability for: %s", hotdog.nombre)
     
     if result['disponible']:
-        print(f"✅ Hay inventario suficiente")
+        log.debug("✅ Hay inventario suficiente")
     else:
-        print(f"❌ Inventario insuficiente")
-        print(f"   Faltantes:")
+        log.debug("❌ Inventario insuficiente")
+        log.debug("   Faltantes:")
         for faltante in result['faltantes']:
-            print(f"   - {faltante['ingrediente']} ({faltante['categoria']}): "
-                  f"necesita {faltante['necesita']}, disponible {faltante['disponible']}")
-    
-    teardown_test_handler(handler)
-    print("\n✅ Test 4 PASSED\n")
+            log.debug(
+                "   - %s (%s): necesita %s, disponible %s",
+                faltante['ingrediente'], faltante['categoria'], faltante['necesita'], faltante['disponible']
+            )
 
 
 # ────────────────────────────────────────────────────────────
 # TESTS - AGREGAR HOT DOG
 # ────────────────────────────────────────────────────────────
 
-def test_5_add_hotdog_success():
+def test_5_add_hotdog_success(handler):
     """Test 5: Add a new hot dog successfully."""
-    print("\n" + "="*70)
-    print("🧪 Test 5: Add hot dog - Success")
-    print("="*70)
-    
-    handler = setup_test_handler()
-    
     # Get ingredient IDs
     panes = handler.ingredientes.get_by_category('Pan')
     salchichas = handler.ingredientes.get_by_category('Salchicha')
@@ -250,15 +173,15 @@ def test_5_add_hotdog_success():
     assert 'hotdog' in result, "Should return created hotdog"
     assert result['hotdog'].nombre == 'test_hotdog_automatico', "Name should match"
     
-    print(f"\n✅ Hot dog creado exitosamente")
-    print(f"   Nombre: {result['hotdog'].nombre}")
-    print(f"   Pan: {result['hotdog'].pan['nombre']} ({pan.tamano} {pan.unidad})")
-    print(f"   Salchicha: {result['hotdog'].salchicha['nombre']} ({salchicha.tamano} {salchicha.unidad})")
+    log.debug("✅ Hot dog creado exitosamente")
+    log.debug("   Nombre: %s", result['hotdog'].nombre)
+    log.debug("   Pan: %s (%s %s)", result['hotdog'].pan['nombre'], pan.tamano, pan.unidad)
+    log.debug("   Salchicha: %s (%s %s)", result['hotdog'].salchicha['nombre'], salchicha.tamano, salchicha.unidad)
     
     if result.get('advertencias'):
-        print(f"\n⚠️  Advertencias:")
+        log.debug("⚠️  Advertencias:")
         for adv in result['advertencias']:
-            print(f"   {adv}")
+            log.debug("   %s", adv)
     
     # Verify it exists
     created = MenuService.get_by_name(handler, 'test_hotdog_automatico')
@@ -266,19 +189,10 @@ def test_5_add_hotdog_success():
     
     # Cleanup
     handler.menu.delete(result['hotdog'].id)
-    
-    teardown_test_handler(handler)
-    print("\n✅ Test 5 PASSED\n")
 
 
-def test_6_add_hotdog_size_mismatch_warning():
+def test_6_add_hotdog_size_mismatch_warning(handler):
     """Test 6: Add hot dog with size mismatch - Should warn."""
-    print("\n" + "="*70)
-    print("🧪 Test 6: Add hot dog - Size mismatch warning")
-    print("="*70)
-    
-    handler = setup_test_handler()
-    
     # Find pan and salchicha with DIFFERENT sizes
     panes = handler.ingredientes.get_by_category('Pan')
     salchichas = handler.ingredientes.get_by_category('Salchicha')
@@ -295,7 +209,7 @@ def test_6_add_hotdog_size_mismatch_warning():
             break
     
     if not pan or not salchicha:
-        print("⚠️  No se encontraron ingredientes con tamaños diferentes, skipping test")
+        log.debug("⚠️  No se encontraron ingredientes con tamaños diferentes, skipping test")
         return
     
     result = MenuService.add_hotdog(
@@ -317,28 +231,19 @@ def test_6_add_hotdog_size_mismatch_warning():
     assert 'tamaños diferentes' in warning_text.lower() or 'tamaño' in warning_text.lower(), \
         "Warning should mention size mismatch"
     
-    print(f"\n✅ Hot dog creado con advertencia de tamaño")
-    print(f"   Pan: {pan.nombre} ({pan.tamano} {pan.unidad})")
-    print(f"   Salchicha: {salchicha.nombre} ({salchicha.tamano} {salchicha.unidad})")
-    print(f"\n⚠️  Advertencias recibidas:")
+    log.debug("✅ Hot dog creado con advertencia de tamaño")
+    log.debug("   Pan: %s (%s %s)", pan.nombre, pan.tamano, pan.unidad)
+    log.debug("   Salchicha: %s (%s %s)", salchicha.nombre, salchicha.tamano, salchicha.unidad)
+    log.debug("⚠️  Advertencias recibidas:")
     for adv in result['advertencias']:
-        print(f"   {adv}")
+        log.debug("   %s", adv)
     
     # Cleanup
     handler.menu.delete(result['hotdog'].id)
-    
-    teardown_test_handler(handler)
-    print("\n✅ Test 6 PASSED\n")
 
 
-def test_7_add_hotdog_validation_errors():
+def test_7_add_hotdog_validation_errors(handler):
     """Test 7: Add hot dog - Validation errors."""
-    print("\n" + "="*70)
-    print("🧪 Test 7: Add hot dog - Validation errors")
-    print("="*70)
-    
-    handler = setup_test_handler()
-    
     # Test 1: Duplicate name
     existing = MenuService.list_all(handler)
     if existing:
@@ -351,7 +256,7 @@ def test_7_add_hotdog_validation_errors():
         
         assert not result['exito'], "Should fail for duplicate name"
         assert 'error' in result, "Should have error message"
-        print(f"✅ Duplicate name rejected: {result['error']}")
+        log.debug("✅ Duplicate name rejected: %s", result['error'])
     
     # Test 2: Invalid ingredient ID
     result = MenuService.add_hotdog(
@@ -363,24 +268,15 @@ def test_7_add_hotdog_validation_errors():
     
     assert not result['exito'], "Should fail for invalid ingredient ID"
     assert 'error' in result, "Should have error message"
-    print(f"✅ Invalid ingredient ID rejected: {result['error']}")
-    
-    teardown_test_handler(handler)
-    print("\n✅ Test 7 PASSED\n")
+    log.debug("✅ Invalid ingredient ID rejected: %s", result['error'])
 
 
 # ────────────────────────────────────────────────────────────
 # TESTS - ELIMINAR HOT DOG
 # ────────────────────────────────────────────────────────────
 
-def test_8_delete_hotdog_with_inventory_requires_confirmation():
+def test_8_delete_hotdog_with_inventory_requires_confirmation(handler):
     """Test 8: Delete hot dog with inventory - Requires confirmation."""
-    print("\n" + "="*70)
-    print("🧪 Test 8: Delete hot dog - Requires confirmation")
-    print("="*70)
-    
-    handler = setup_test_handler()
-    
     # Create a test hotdog
     panes = handler.ingredientes.get_by_category('Pan')
     salchichas = handler.ingredientes.get_by_category('Salchicha')
@@ -413,8 +309,8 @@ def test_8_delete_hotdog_with_inventory_requires_confirmation():
     assert result.get('requiere_confirmacion'), "Should require confirmation"
     assert 'advertencia' in result, "Should have warning message"
     
-    print(f"\n✅ Deletion blocked, confirmation required")
-    print(f"   {result['advertencia']}")
+    log.debug("✅ Deletion blocked, confirmation required")
+    log.debug("   %s", result['advertencia'])
     
     # Now delete WITH confirmation
     result = MenuService.delete_hotdog(handler, hotdog_id, confirmar_con_inventario=True)
@@ -422,21 +318,12 @@ def test_8_delete_hotdog_with_inventory_requires_confirmation():
     assert result['exito'], "Should succeed with confirmation"
     assert 'hotdog_eliminado' in result, "Should return deleted hotdog"
     
-    print(f"\n✅ Hot dog deleted with confirmation")
-    print(f"   Deleted: {result['hotdog_eliminado'].nombre}")
-    
-    teardown_test_handler(handler)
-    print("\n✅ Test 8 PASSED\n")
+    log.debug("✅ Hot dog deleted with confirmation")
+    log.debug("   Deleted: %s", result['hotdog_eliminado'].nombre)
 
 
-def test_9_delete_hotdog_without_inventory():
+def test_9_delete_hotdog_without_inventory(handler):
     """Test 9: Delete hot dog without inventory - Direct deletion."""
-    print("\n" + "="*70)
-    print("🧪 Test 9: Delete hot dog without inventory")
-    print("="*70)
-    
-    handler = setup_test_handler()
-    
     # Create a hotdog with ingredients that have NO inventory
     panes = handler.ingredientes.get_by_category('Pan')
     salchichas = handler.ingredientes.get_by_category('Salchicha')
@@ -467,141 +354,59 @@ def test_9_delete_hotdog_without_inventory():
     
     # Debug: Check availability before deletion
     availability = MenuService.check_availability(handler, hotdog_id)
-    print(f"\n🔍 Debug - Availability check:")
-    print(f"   Disponible: {availability['disponible']}")
+    log.debug("🔍 Debug - Availability check:")
+    log.debug("   Disponible: %s", availability['disponible'])
     if not availability['disponible']:
-        print(f"   Faltantes: {availability.get('faltantes', [])}")
+        log.debug("   Faltantes: %s", availability.get('faltantes', []))
     
     # Try to delete (should succeed immediately since no inventory)
     result = MenuService.delete_hotdog(handler, hotdog_id, confirmar_con_inventario=False)
     
-    print(f"\n🔍 Debug - Delete result:")
-    print(f"   Exito: {result.get('exito')}")
-    print(f"   Requiere confirmacion: {result.get('requiere_confirmacion')}")
+    log.debug("🔍 Debug - Delete result:")
+    log.debug("   Exito: %s", result.get('exito'))
+    log.debug("   Requiere confirmacion: %s", result.get('requiere_confirmacion'))
     if 'advertencia' in result:
-        print(f"   Advertencia: {result['advertencia']}")
+        log.debug("   Advertencia: %s", result['advertencia'])
     if 'error' in result:
-        print(f"   Error: {result['error']}")
+        log.debug("   Error: %s", result['error'])
     
     assert result['exito'], f"Should succeed without confirmation (no inventory). Got: {result}"
     assert 'hotdog_eliminado' in result, "Should return deleted hotdog"
     assert not result.get('requiere_confirmacion'), "Should NOT require confirmation"
     
-    print(f"\n✅ Hot dog deleted directly (no inventory)")
-    print(f"   Deleted: {result['hotdog_eliminado'].nombre}")
+    log.debug("✅ Hot dog deleted directly (no inventory)")
+    log.debug("   Deleted: %s", result['hotdog_eliminado'].nombre)
     
     # Restore stock
     IngredientService.update_stock(handler, pan.id, original_pan_stock)
     IngredientService.update_stock(handler, salchicha.id, original_salchicha_stock)
-    
-    teardown_test_handler(handler)
-    print("\n✅ Test 9 PASSED\n")
 
 
-def test_10_delete_nonexistent_hotdog():
+def test_10_delete_nonexistent_hotdog(handler):
     """Test 10: Delete non-existent hot dog."""
-    print("\n" + "="*70)
-    print("🧪 Test 10: Delete non-existent hot dog")
-    print("="*70)
-    
-    handler = setup_test_handler()
-    
     result = MenuService.delete_hotdog(handler, 'id_que_no_existe_xyz')
     
     assert not result['exito'], "Should fail"
     assert 'error' in result, "Should have error message"
     
-    print(f"✅ Non-existent hotdog deletion rejected: {result['error']}")
-    
-    teardown_test_handler(handler)
-    print("\n✅ Test 10 PASSED\n")
+    log.debug("✅ Non-existent hotdog deletion rejected: %s", result['error'])
 
 
 # ────────────────────────────────────────────────────────────
 # TESTS - ESTADÍSTICAS
 # ────────────────────────────────────────────────────────────
 
-def test_11_get_stats():
+def test_11_get_stats(handler):
     """Test 11: Get menu statistics."""
-    print("\n" + "="*70)
-    print("🧪 Test 11: Get menu statistics")
-    print("="*70)
-    
-    handler = setup_test_handler()
-    
     stats = MenuService.get_stats(handler)
     
     assert 'total' in stats, "Should have total count"
     assert 'combos' in stats, "Should have combos count"
     assert 'simples' in stats, "Should have simples count"
     
-    print(f"\n📊 Menu Statistics:")
-    print(f"   Total hot dogs: {stats['total']}")
-    print(f"   Combos: {stats['combos']}")
-    print(f"   Simples: {stats['simples']}")
-    print(f"   Con toppings: {stats['con_toppings']}")
-    print(f"   Con salsas: {stats['con_salsas']}")
-    
-    teardown_test_handler(handler)
-    print("\n✅ Test 11 PASSED\n")
-
-
-# ────────────────────────────────────────────────────────────
-# RUN ALL TESTS
-# ────────────────────────────────────────────────────────────
-
-def run_all_tests():
-    """Run all MenuService tests."""
-    print("\n" + "="*70)
-    print("🚀 MENU SERVICE TEST SUITE")
-    print("="*70)
-    
-    tests = [
-        test_1_list_all_hotdogs,
-        test_2_get_by_name,
-        test_3_get_combos_and_simple,
-        test_4_check_availability,
-        test_5_add_hotdog_success,
-        test_6_add_hotdog_size_mismatch_warning,
-        test_7_add_hotdog_validation_errors,
-        test_8_delete_hotdog_with_inventory_requires_confirmation,
-        test_9_delete_hotdog_without_inventory,
-        test_10_delete_nonexistent_hotdog,
-        test_11_get_stats,
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test_func in tests:
-        try:
-            test_func()
-            passed += 1
-        except AssertionError as e:
-            print(f"\n❌ TEST FAILED: {test_func.__name__}")
-            print(f"   Error: {e}")
-            failed += 1
-        except Exception as e:
-            print(f"\n💥 TEST ERROR: {test_func.__name__}")
-            print(f"   Exception: {e}")
-            import traceback
-            traceback.print_exc()
-            failed += 1
-    
-    print("\n" + "="*70)
-    print("📊 FINAL RESULTS")
-    print("="*70)
-    print(f"✅ Passed: {passed}/{len(tests)}")
-    print(f"❌ Failed: {failed}/{len(tests)}")
-    
-    if failed == 0:
-        print("\n🎉 ALL TESTS PASSED!")
-    
-    print("="*70 + "\n")
-    
-    return failed == 0
-
-
-if __name__ == "__main__":
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
+    log.debug("📊 Menu Statistics:")
+    log.debug("   Total hot dogs: %s", stats['total'])
+    log.debug("   Combos: %s", stats['combos'])
+    log.debug("   Simples: %s", stats['simples'])
+    log.debug("   Con toppings: %s", stats['con_toppings'])
+    log.debug("   Con salsas: %s", stats['con_salsas'])
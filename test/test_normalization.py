@@ -0,0 +1,52 @@
+"""
+Tests for the Key Normalization Adapter.
+
+Author: Rafael Correa
+Date: November 17, 2025
+"""
+
+import pytest
+
+from clients.external_sources.frozen_source import FrozenSource
+from clients.adapters import KeyNormalizationAdapter
+from clients.adapters.key_normalization_adapter import normalize_key
+
+
+def _all_keys(data):
+    """All dictionary keys at any nesting level of a JSON-like structure."""
+    if isinstance(data, dict):
+        keys = list(data.keys())
+        for value in data.values():
+            keys.extend(_all_keys(value))
+        return keys
+    if isinstance(data, list):
+        return [key for item in data for key in _all_keys(item)]
+    return []
+
+
+@pytest.mark.parametrize(
+    "raw_fixture, expected_keys",
+    [
+        ("raw_ingredientes", {'categoria', 'opciones'}),
+        ("raw_menu", {'nombre'}),
+    ],
+    ids=["grouped", "flat"]
+)
+def test_4_key_normalization_adapter(request, raw_fixture, expected_keys):
+    """Test 4: Key Normalization Adapter normalizes keys."""
+    raw = request.getfixturevalue(raw_fixture)
+    adapter = KeyNormalizationAdapter(FrozenSource({raw_fixture: raw}))
+    hits_before = normalize_key.cache_info().hits
+    data = adapter.fetch_data(raw_fixture)
+    assert normalize_key.cache_info().hits > hits_before, "Repeated keys should hit the cache"
+    
+    first = data[0]
+    assert expected_keys <= first.keys(), f"Should have {expected_keys} (lowercase)"
+    
+    # Every key at every level is lowercase ASCII (no accents, no ñ): one
+    # C-level check over all keys joined; per-key scan only to report failures
+    keys = _all_keys(data)
+    joined = "".join(keys)
+    if not (joined.islower() and joined.isascii()):
+        bad_keys = [key for key in keys if key != key.lower() or not key.isascii()]
+        pytest.fail(f"Keys not normalized: {bad_keys}")
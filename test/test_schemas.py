@@ -8,11 +8,7 @@ Author: Rafael Correa
 Date: November 14, 2025
 """
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path to import modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import logging
 
 from models.schemas.ingredient_schemas import (
     infer_schemas_from_data,
@@ -27,26 +23,17 @@ from models.schemas.hotdog_schemas import (
     HOTDOG_SCHEMAS_FALLBACK
 )
 
-# Import data source to test with real data
+# Real data comes from the conftest `github_client` (recorded payloads by default)
 from clients.data_source_client import DataSourceClient
-from clients.external_sources.github_client import GitHubClient
 from clients.adapters.id_adapter import IDAdapter
 from clients.adapters.key_normalization_adapter import KeyNormalizationAdapter
 from clients.id_processors import process_grouped_structure_ids, process_flat_structure_ids
-from config import GITHUB_OWNER, GITHUB_REPO, GITHUB_BRANCH
-
 
-def print_separator(title):
-    """Print a formatted separator."""
-    print("\n" + "="*70)
-    print(f"  {title}")
-    print("="*70)
+log = logging.getLogger(__name__)
 
 
 def test_find_common_properties():
     """Test the find_common_properties function."""
-    print_separator("TEST 1: Find Common Properties")
-    
     # Test case 1: All schemas have 'nombre' in common (id excluded from schemas now)
     schemas = {
         'Pan': ['nombre', 'tipo', 'tamano', 'unidad'],
@@ -56,11 +43,12 @@ def test_find_common_properties():
     }
     
     common = find_common_properties(schemas)
-    print(f"\n📋 Input schemas: {len(schemas)} types")
+    log.debug("📋 Input schemas: %s types", len(schemas))
     for entity_type, props in schemas.items():
-        print(f"   - {entity_type}: {props}")
+        log.debug("   - %s: %s", entity_type, props)
     
-    print(f"\n✅ Common properties found: {common}")
+    log.debug("✅ Common properties found: %s", common)
+    assert set(common) == {'nombre', 'tipo'}, "Every schema shares nombre and tipo"
     
     # Test case 2: No common properties
     schemas_no_common = {
@@ -69,22 +57,20 @@ def test_find_common_properties():
     }
     
     common_none = find_common_properties(schemas_no_common)
-    print(f"\n📋 Schemas with no common properties:")
-    print(f"   {schemas_no_common}")
-    print(f"   Result: {common_none}")
+    log.debug("📋 Schemas with no common properties:")
+    log.debug("   %s", schemas_no_common)
+    log.debug("   Result: %s", common_none)
+    assert common_none == [], "Disjoint schemas have no common properties"
     
     # Test case 3: Empty schemas
     empty_result = find_common_properties({})
-    print(f"\n📋 Empty schemas dict:")
-    print(f"   Result: {empty_result}")
-    
-    return common
+    log.debug("📋 Empty schemas dict:")
+    log.debug("   Result: %s", empty_result)
+    assert empty_result == [], "No schemas, no common properties"
 
 
 def test_infer_ingredient_schemas_with_mock_data():
     """Test ingredient schema inference with mock data."""
-    print_separator("TEST 2: Infer Ingredient Schemas (Mock Data)")
-    
     # Mock data structure (GROUPED - with categories and options)
     mock_data = [
         {
@@ -130,32 +116,26 @@ def test_infer_ingredient_schemas_with_mock_data():
         }
     ]
     
-    print("\n📋 Mock data structure:")
-    print(f"   Categories: {[cat['categoria'] for cat in mock_data]}")
+    log.debug("📋 Mock data structure:")
+    log.debug("   Categories: %s", [cat['categoria'] for cat in mock_data])
     
     specific_schemas, common_properties = infer_schemas_from_data(mock_data)
     
-    print(f"\n✅ Common properties (for base class): {common_properties}")
-    print(f"\n✅ Specific schemas (for subclasses):")
+    log.debug("✅ Common properties (for base class): %s", common_properties)
+    log.debug("✅ Specific schemas (for subclasses):")
     
     for entity_type, props in specific_schemas.items():
-        print(f"   - {entity_type}: {props}")
+        log.debug("   - %s: %s", entity_type, props)
 
     # Verify results (note: 'id' is excluded from schemas now, it's technical metadata)
     assert 'nombre' in common_properties, "Expected 'nombre' in common properties"
     assert 'id' not in common_properties, "'id' should NOT be in schemas (technical metadata)"
     assert 'Pan' in specific_schemas, "Expected 'Pan' in specific schemas (capitalized)"
     assert 'Toppings' in specific_schemas, "Expected 'Toppings' in specific schemas"
-    
-    print("\n✅ All assertions passed!")
-    
-    return specific_schemas, common_properties
 
 
 def test_infer_hotdog_schema_with_mock_data():
     """Test hotdog schema inference with mock data."""
-    print_separator("TEST 3: Infer HotDog Schema (Mock Data)")
-    
     # Mock data structure (FLAT - list of objects)
     mock_data = [
         {
@@ -178,15 +158,15 @@ def test_infer_hotdog_schema_with_mock_data():
         }
     ]
     
-    print("\n📋 Mock data structure:")
-    print(f"   Hot dogs: {len(mock_data)}")
-    print(f"   First item keys: {list(mock_data[0].keys())}")
+    log.debug("📋 Mock data structure:")
+    log.debug("   Hot dogs: %s", len(mock_data))
+    log.debug("   First item keys: %s", list(mock_data[0].keys()))
     
     schema = infer_hotdog_schema(mock_data)
     
-    print(f"\n✅ Inferred schema:")
+    log.debug("✅ Inferred schema:")
     for entity_type, props in schema.items():
-        print(f"   - {entity_type}: {props}")
+        log.debug("   - %s: %s", entity_type, props)
     
     # Verify results (note: 'id' should be excluded as it's technical metadata)
     assert 'HotDog' in schema, "Expected 'HotDog' in schema"
@@ -194,248 +174,167 @@ def test_infer_hotdog_schema_with_mock_data():
     assert 'pan' in schema['HotDog'], "Expected 'pan' in HotDog schema"
     assert 'id' not in schema['HotDog'], "'id' should NOT be in schema (technical metadata)"
     assert schema['HotDog'][0] == 'nombre', "Expected 'nombre' to be first property"
-    
-    print("\n✅ All assertions passed!")
-    
-    return schema
 
 
 def test_ingredient_schemas_with_fallback():
     """Test ingredient schema getter with fallback (no data)."""
-    print_separator("TEST 4: Ingredient Schemas with Fallback")
-    
-    print("\n📋 Calling get_ingredient_schemas() without data...")
+    log.debug("📋 Calling get_ingredient_schemas() without data...")
     
     specific_schemas, common_properties = get_ingredient_schemas(raw_data=None)
     
-    print(f"\n✅ Using fallback schemas:")
-    print(f"   Common properties: {common_properties}")
-    print(f"   Specific schemas:")
+    log.debug("✅ Using fallback schemas:")
+    log.debug("   Common properties: %s", common_properties)
+    log.debug("   Specific schemas:")
     for entity_type, props in specific_schemas.items():
-        print(f"      - {entity_type}: {props}")
+        log.debug("      - %s: %s", entity_type, props)
     
     # Verify it matches fallback
     assert specific_schemas == INGREDIENT_SCHEMAS_FALLBACK, "Should use fallback schemas"
     assert common_properties == INGREDIENT_BASE_PROPERTIES_FALLBACK, "Should use fallback base properties"
     
-    print("\n✅ Fallback mechanism working correctly!")
-    
-    return specific_schemas, common_properties
+    log.debug("✅ Fallback mechanism working correctly!")
 
 
 def test_hotdog_schemas_with_fallback():
     """Test hotdog schema getter with fallback (no data)."""
-    print_separator("TEST 5: HotDog Schemas with Fallback")
-    
-    print("\n📋 Calling get_hotdog_schemas() without data...")
+    log.debug("📋 Calling get_hotdog_schemas() without data...")
     
     schemas = get_hotdog_schemas(raw_data=None)
     
-    print(f"\n✅ Using fallback schemas:")
+    log.debug("✅ Using fallback schemas:")
     for entity_type, props in schemas.items():
-        print(f"   - {entity_type}: {props}")
+        log.debug("   - %s: %s", entity_type, props)
     
     # Verify it matches fallback
     assert schemas == HOTDOG_SCHEMAS_FALLBACK, "Should use fallback schemas"
     
-    print("\n✅ Fallback mechanism working correctly!")
+    log.debug("✅ Fallback mechanism working correctly!")
+
+
+def _real_ingredient_schemas(github_client, data_dir):
+    """
+    Infer ingredient schemas from the real ingredientes data.
+    
+    Args:
+        github_client: Source of raw GitHub payloads (conftest `github_client`)
+        data_dir: Directory the DataSourceClient persists into
+    
+    Returns:
+        Tuple of (specific_schemas, common_properties)
+    """
+    # Setup GitHub client with adapters
+    with_ids = IDAdapter(github_client, process_grouped_structure_ids)
+    fully_processed = KeyNormalizationAdapter(with_ids)
+    
+    data_source = DataSourceClient(data_dir=str(data_dir))
+    data_source.initialize({'ingredientes': fully_processed})
     
-    return schemas
+    ingredientes_data = data_source.get('ingredientes')
+    log.debug("✅ Data loaded successfully!")
+    log.debug("   Categories found: %s", len(ingredientes_data))
+    
+    return get_ingredient_schemas(ingredientes_data)
 
 
-def test_ingredient_schemas_with_real_data():
+def _real_hotdog_schemas(github_client, data_dir):
+    """
+    Infer the HotDog schema from the real menu data.
+    
+    Args:
+        github_client: Source of raw GitHub payloads (conftest `github_client`)
+        data_dir: Directory the DataSourceClient persists into
+    
+    Returns:
+        Schema dict
+    """
+    # Setup GitHub client with adapters
+    with_ids = IDAdapter(github_client, process_flat_structure_ids)
+    fully_processed = KeyNormalizationAdapter(with_ids)
+    
+    data_source = DataSourceClient(data_dir=str(data_dir))
+    data_source.initialize({'menu': fully_processed})
+    
+    menu_data = data_source.get('menu')
+    log.debug("✅ Data loaded successfully!")
+    log.debug("   Hot dogs found: %s", len(menu_data))
+    
+    return get_hotdog_schemas(menu_data)
+
+
+def test_ingredient_schemas_with_real_data(github_client, tmp_path):
     """Test ingredient schema inference with real data from DataSource."""
-    print_separator("TEST 6: Ingredient Schemas with Real Data")
-    
-    print("\n📋 Setting up DataSource with GitHub...")
-    
-    try:
-        # Setup GitHub client with adapters
-        github = GitHubClient(GITHUB_OWNER, GITHUB_REPO, GITHUB_BRANCH)
-        with_ids = IDAdapter(github, process_grouped_structure_ids)
-        fully_processed = KeyNormalizationAdapter(with_ids)
-        
-        # Initialize data source
-        data_source = DataSourceClient(data_dir='data')
-        
-        print("   Initializing data source (trying local first)...")
-        data_source.initialize({
-            'ingredientes': fully_processed
-        }, force_external=False)
-        
-        # Get real data
-        ingredientes_data = data_source.get('ingredientes')
-        
-        print(f"\n✅ Data loaded successfully!")
-        print(f"   Categories found: {len(ingredientes_data)}")
-        
-        # Infer schemas from real data
-        specific_schemas, common_properties = get_ingredient_schemas(ingredientes_data)
-        
-        print(f"\n✅ Schemas inferred from real data:")
-        print(f"   Common properties (base class): {common_properties}")
-        print(f"\n   Specific schemas (subclasses):")
-        for entity_type, props in specific_schemas.items():
-            print(f"      - {entity_type}: {props}")
-        
-        # Verify we got meaningful results
-        assert len(common_properties) > 0, "Should have at least one common property"
-        assert len(specific_schemas) > 0, "Should have at least one entity type"
-        
-        print("\n✅ Real data inference successful!")
-        
-        return specific_schemas, common_properties
-        
-    except Exception as e:
-        print(f"\n⚠️  Could not load real data: {e}")
-        print("   This is expected if data files don't exist yet")
-        print("   Skipping this test...")
-        return None, None
+    log.debug("📋 Setting up DataSource with GitHub...")
+    specific_schemas, common_properties = _real_ingredient_schemas(github_client, tmp_path)
+    
+    log.debug("✅ Schemas inferred from real data:")
+    log.debug("   Common properties (base class): %s", common_properties)
+    log.debug("   Specific schemas (subclasses):")
+    for entity_type, props in specific_schemas.items():
+        log.debug("      - %s: %s", entity_type, props)
+    
+    # Verify we got meaningful results
+    assert len(common_properties) > 0, "Should have at least one common property"
+    assert len(specific_schemas) > 0, "Should have at least one entity type"
+    
+    log.debug("✅ Real data inference successful!")
 
 
-def test_hotdog_schemas_with_real_data():
+def test_hotdog_schemas_with_real_data(github_client, tmp_path):
     """Test hotdog schema inference with real data from DataSource."""
-    print_separator("TEST 7: HotDog Schemas with Real Data")
-    
-    print("\n📋 Setting up DataSource with GitHub...")
-    
-    try:
-        # Setup GitHub client with adapters
-        github = GitHubClient(GITHUB_OWNER, GITHUB_REPO, GITHUB_BRANCH)
-        with_ids = IDAdapter(github, process_flat_structure_ids)
-        fully_processed = KeyNormalizationAdapter(with_ids)
-        
-        # Initialize data source
-        data_source = DataSourceClient(data_dir='data')
-        
-        print("   Initializing data source (trying local first)...")
-        data_source.initialize({
-            'menu': fully_processed
-        }, force_external=False)
-        
-        # Get real data
-        menu_data = data_source.get('menu')
-        
-        print(f"\n✅ Data loaded successfully!")
-        print(f"   Hot dogs found: {len(menu_data)}")
-        
-        # Infer schemas from real data
-        schemas = get_hotdog_schemas(menu_data)
-        
-        print(f"\n✅ Schemas inferred from real data:")
-        for entity_type, props in schemas.items():
-            print(f"   - {entity_type}: {props}")
-        
-        # Verify we got meaningful results
-        assert 'HotDog' in schemas, "Should have HotDog entity"
-        assert len(schemas['HotDog']) > 0, "HotDog should have properties"
-        
-        print("\n✅ Real data inference successful!")
-        
-        return schemas
-        
-    except Exception as e:
-        print(f"\n⚠️  Could not load real data: {e}")
-        print("   This is expected if data files don't exist yet")
-        print("   Skipping this test...")
-        return None
+    log.debug("📋 Setting up DataSource with GitHub...")
+    schemas = _real_hotdog_schemas(github_client, tmp_path)
+    
+    log.debug("✅ Schemas inferred from real data:")
+    for entity_type, props in schemas.items():
+        log.debug("   - %s: %s", entity_type, props)
+    
+    # Verify we got meaningful results
+    assert 'HotDog' in schemas, "Should have HotDog entity"
+    assert len(schemas['HotDog']) > 0, "HotDog should have properties"
+    
+    log.debug("✅ Real data inference successful!")
 
 
-def test_schema_inference_comparison():
+def test_schema_inference_comparison(github_client, tmp_path):
     """Compare schemas from fallback vs real data."""
-    print_separator("TEST 8: Fallback vs Real Data Comparison")
-    
-    print("\n📋 Getting fallback schemas...")
+    log.debug("📋 Getting fallback schemas...")
     fallback_ingredient_specific, fallback_ingredient_common = get_ingredient_schemas(None)
     fallback_hotdog = get_hotdog_schemas(None)
     
-    print("\n📋 Attempting to get real data schemas...")
-    real_ingredient_specific, real_ingredient_common = test_ingredient_schemas_with_real_data()
-    real_hotdog = test_hotdog_schemas_with_real_data()
-    
-    if real_ingredient_specific is not None:
-        print("\n📊 INGREDIENT SCHEMAS COMPARISON:")
-        print("\n   Fallback common properties:", fallback_ingredient_common)
-        print("   Real data common properties:", real_ingredient_common)
-        
-        print("\n   Fallback entity types:", list(fallback_ingredient_specific.keys()))
-        print("   Real data entity types:", list(real_ingredient_specific.keys()))
-        
-        # Compare specific schemas
-        for entity_type in fallback_ingredient_specific.keys():
-            if entity_type in real_ingredient_specific:
-                fallback_props = set(fallback_ingredient_specific[entity_type])
-                real_props = set(real_ingredient_specific[entity_type])
-                
-                if fallback_props != real_props:
-                    print(f"\n   ⚠️  Difference in {entity_type}:")
-                    print(f"      Fallback: {fallback_props}")
-                    print(f"      Real:     {real_props}")
-                else:
-                    print(f"   ✅ {entity_type}: Schemas match!")
-    
-    if real_hotdog is not None:
-        print("\n📊 HOTDOG SCHEMAS COMPARISON:")
-        print("\n   Fallback properties:", fallback_hotdog['HotDog'])
-        print("   Real data properties:", real_hotdog['HotDog'])
-        
-        fallback_props = set(fallback_hotdog['HotDog'])
-        real_props = set(real_hotdog['HotDog'])
-        
-        if fallback_props != real_props:
-            print(f"\n   ⚠️  Differences found:")
-            print(f"      Only in fallback: {fallback_props - real_props}")
-            print(f"      Only in real data: {real_props - fallback_props}")
-        else:
-            print(f"   ✅ Schemas match!")
-
-
-def run_all_tests():
-    """Run all schema tests."""
-    print("\n" + "🧬" * 35)
-    print("   SCHEMA INFERENCE SYSTEM - TEST SUITE")
-    print("🧬" * 35)
-    
-    try:
-        # # Test 1: Common properties extraction
-        test_find_common_properties()
-        
-        # # Test 2: Ingredient schema inference with mock data
-        test_infer_ingredient_schemas_with_mock_data()
-        
-        # # Test 3: HotDog schema inference with mock data
-        test_infer_hotdog_schema_with_mock_data()
-        
-        # # Test 4: Ingredient schemas with fallback
-        test_ingredient_schemas_with_fallback()
-        
-        # # Test 5: HotDog schemas with fallback
-        test_hotdog_schemas_with_fallback()
-        
-        # Test 6-7: Real data tests (may skip if data not available)
-        test_ingredient_schemas_with_real_data()
-        test_hotdog_schemas_with_real_data()
-        
-        # Test 8: Comparison
-        test_schema_inference_comparison()
-        
-        # Final summary
-        print_separator("TEST SUITE COMPLETED")
-        print("\n✅ All schema inference tests passed successfully!")
-        print("\n📝 Summary:")
-        print("   - Common property extraction: ✅")
-        print("   - GROUPED structure inference: ✅")
-        print("   - FLAT structure inference: ✅")
-        print("   - Fallback mechanisms: ✅")
-        print("   - Real data integration: ✅")
-        
-    except AssertionError as e:
-        print(f"\n❌ Test failed: {e}")
-        raise
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
-        raise
-
-
-if __name__ == '__main__':
-    run_all_tests()
+    log.debug("📋 Attempting to get real data schemas...")
+    real_ingredient_specific, real_ingredient_common = _real_ingredient_schemas(github_client, tmp_path)
+    real_hotdog = _real_hotdog_schemas(github_client, tmp_path)
+    
+    log.debug("📊 INGREDIENT SCHEMAS COMPARISON:")
+    log.debug("   Fallback common properties: %s", fallback_ingredient_common)
+    log.debug("   Real data common properties: %s", real_ingredient_common)
+    
+    log.debug("   Fallback entity types: %s", list(fallback_ingredient_specific.keys()))
+    log.debug("   Real data entity types: %s", list(real_ingredient_specific.keys()))
+    
+    # Compare specific schemas
+    for entity_type in fallback_ingredient_specific.keys():
+        if entity_type in real_ingredient_specific:
+            fallback_props = set(fallback_ingredient_specific[entity_type])
+            real_props = set(real_ingredient_specific[entity_type])
+            
+            if fallback_props != real_props:
+                log.debug("   ⚠️  Difference in %s:", entity_type)
+                log.debug("      Fallback: %s", fallback_props)
+                log.debug("      Real:     %s", real_props)
+            else:
+                log.debug("   ✅ %s: Schemas match!", entity_type)
+    
+    log.debug("📊 HOTDOG SCHEMAS COMPARISON:")
+    log.debug("   Fallback properties: %s", fallback_hotdog['HotDog'])
+    log.debug("   Real data properties: %s", real_hotdog['HotDog'])
+    
+    fallback_props = set(fallback_hotdog['HotDog'])
+    real_props = set(real_hotdog['HotDog'])
+    
+    if fallback_props != real_props:
+        log.debug("   ⚠️  Differences found:")
+        log.debug("      Only in fallback: %s", fallback_props - real_props)
+        log.debug("      Only in real data: %s", real_props - fallback_props)
+    else:
+        log.debug("   ✅ Schemas match!")